@@ -1,6 +1,5 @@
 import asyncio
-import sys
-from pathlib import Path
+from collections import deque
 
 import pytest
 
@@ -8,12 +7,6 @@ import pytest
 pytest_plugins = ["pytest_asyncio"]
 
 
-# Ensure project root is on sys.path for local test runs without installation.
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
-
 @pytest.fixture
 def tmp_config_dir(tmp_path, monkeypatch):
     cfg = tmp_path / "config"
@@ -34,9 +27,14 @@ def clipboard_spy():
 
 
 class _FakeResponse:
-    def __init__(self, status_code: int = 200, text: str = "{}") -> None:
+    def __init__(self, status_code: int = 200, text: str = "{}", encoding: str = "utf-8") -> None:
         self.status_code = status_code
         self.text = text
+        self.encoding = encoding
+
+    @property
+    def content(self) -> bytes:
+        return self.text.encode(self.encoding)
 
 
 class FakeHttpxClient:
@@ -44,8 +42,12 @@ class FakeHttpxClient:
         self.requests: list[tuple[str, str, bytes | None, dict[str, str]]] = []
         self.response = response or _FakeResponse()
 
-    async def post(self, endpoint: str, json=None, headers=None):  # noqa: A002 - json matches httpx signature
-        self.requests.append(("POST", endpoint, None, headers or {}))
+    def reset(self) -> None:
+        self.requests.clear()
+        self.response = _FakeResponse()
+
+    async def post(self, endpoint: str, json=None, content=None, headers=None):  # noqa: A002 - json matches httpx signature
+        self.requests.append(("POST", endpoint, content, headers or {}))
         return self.response
 
     async def request(self, method: str, url: str, content=None, headers=None):
@@ -54,11 +56,17 @@ class FakeHttpxClient:
         return self.response
 
 
-@pytest.fixture
-def fake_httpx_client():
+@pytest.fixture(scope="module")
+def shared_httpx_client():
     return FakeHttpxClient()
 
 
+@pytest.fixture
+def fake_httpx_client(shared_httpx_client):
+    shared_httpx_client.reset()
+    return shared_httpx_client
+
+
 @pytest.fixture
 def fake_client_factory(fake_httpx_client):
     async def factory():
@@ -70,13 +78,22 @@ def fake_client_factory(fake_httpx_client):
 class StubWebSocket:
     def __init__(self) -> None:
         self.sent: list[str] = []
-        self.recv_queue: asyncio.Queue[str] = asyncio.Queue()
+        self._frames: deque[str] = deque()
+        self._has_frames = asyncio.Event()
+
+    def push(self, message: str) -> None:
+        """Queue an incoming frame for recv()."""
+        self._frames.append(message)
+        self._has_frames.set()
 
     async def send(self, message: str) -> None:
         self.sent.append(message)
 
     async def recv(self) -> str:
-        return await self.recv_queue.get()
+        while not self._frames:
+            self._has_frames.clear()
+            await self._has_frames.wait()
+        return self._frames.popleft()
 
     async def close(self) -> None:
         return None
@@ -1,8 +1,13 @@
 # ruff: noqa: S101
+import asyncio
+
 import pytest
 
+from voyager._tls import ssl_context
 from voyager.http_client import (
+    _shared_client,
     _validate_url,
+    aclose_clients,
     perform_http_request,
     perform_request,
 )
@@ -18,6 +23,26 @@ async def test_perform_request_uses_requester():
     assert resp.text == "ok"
 
 
+@pytest.mark.asyncio
+async def test_perform_request_sends_preencoded_body(fake_client_factory, fake_httpx_client):
+    body = b'{"query":"{ ok }","variables":{}}'
+
+    resp = await perform_request("https://example.com", body, {}, True, client_factory=fake_client_factory)
+
+    assert resp.status == 200
+    assert fake_httpx_client.requests[0][2] == body
+    assert fake_httpx_client.requests[0][3] == {"Content-Type": "application/json"}
+
+
+@pytest.mark.asyncio
+async def test_perform_request_keeps_caller_content_type(fake_client_factory, fake_httpx_client):
+    headers = {"Content-Type": "application/graphql+json"}
+
+    await perform_request("https://example.com", b"{}", headers, True, client_factory=fake_client_factory)
+
+    assert fake_httpx_client.requests[0][3] == {"Content-Type": "application/graphql+json"}
+
+
 @pytest.mark.asyncio
 async def test_perform_http_request_with_client_factory(fake_client_factory, fake_httpx_client):
     fake_httpx_client.response.status_code = 201
@@ -37,6 +62,19 @@ async def test_perform_http_request_with_client_factory(fake_client_factory, fak
     assert fake_httpx_client.requests[0][0] == "POST"
 
 
+@pytest.mark.asyncio
+async def test_perform_http_request_decodes_with_response_charset(fake_client_factory, fake_httpx_client):
+    fake_httpx_client.response.text = "café"
+    fake_httpx_client.response.encoding = "latin-1"
+
+    resp = await perform_http_request(
+        "https://api.example.com", "GET", headers={}, body=None, verify_tls=True, client_factory=fake_client_factory
+    )
+
+    assert resp.body == b"caf\xe9"
+    assert resp.text == "café"
+
+
 @pytest.mark.asyncio
 async def test_perform_http_request_with_requester_override():
     async def requester(endpoint, method, headers, body, verify_tls):
@@ -57,3 +95,29 @@ async def test_perform_http_request_with_requester_override():
 def test_validate_url_rejects_invalid_scheme():
     with pytest.raises(ValueError, match="Unsupported URL scheme"):
         _validate_url("ftp://example.com")
+
+
+@pytest.mark.asyncio
+async def test_shared_client_is_reused_until_closed():
+    first = await _shared_client(verify_tls=True)
+    assert await _shared_client(verify_tls=True) is first
+    assert await _shared_client(verify_tls=False) is not first
+    await aclose_clients()
+    assert first.is_closed
+    assert await _shared_client(verify_tls=True) is not first
+    await aclose_clients()
+
+
+def test_shared_client_is_closed_when_the_loop_changes():
+    first = asyncio.run(_shared_client(verify_tls=True))
+    second = asyncio.run(_shared_client(verify_tls=True))
+    assert second is not first
+    assert first.is_closed
+    asyncio.run(aclose_clients())
+
+
+def test_ssl_context_is_cached_per_verify_mode():
+    assert ssl_context(True) is ssl_context(True)
+    insecure = ssl_context(False)
+    assert insecure is not ssl_context(True)
+    assert insecure.check_hostname is False
@@ -1,7 +1,16 @@
 # ruff: noqa: S101
 import json
 
-from voyager.introspection import add_types_to_tree, build_introspection_result
+from voyager.introspection import (
+    BUCKET_THRESHOLD,
+    FieldInfo,
+    TypeInfo,
+    _type_repr,
+    add_types_to_tree,
+    build_introspection_result,
+    expand_tree_node,
+    format_node_details,
+)
 from voyager.models import GraphQLResponse
 
 
@@ -11,9 +20,10 @@ class _Node:
         self.children: list[_Node] = []
         self.data = None
 
-    def add(self, label: str, data=None):
+    def add(self, label: str, data=None, allow_expand=True):
         child = _Node(label)
         child.data = data
+        child.allow_expand = allow_expand
         self.children.append(child)
         return child
 
@@ -48,7 +58,7 @@ def test_build_introspection_result_success():
             }
         }
     }
-    resp = GraphQLResponse(status=200, text=json.dumps(payload), duration_ms=1.0)
+    resp = GraphQLResponse(status=200, body=json.dumps(payload).encode(), duration_ms=1.0)
     result = build_introspection_result(resp)
     assert result.success is True
     assert result.types[0].name == "Query"
@@ -58,7 +68,7 @@ def test_build_introspection_result_success():
 
 def test_build_introspection_result_errors_field():
     payload = {"errors": [{"message": "boom"}]}
-    resp = GraphQLResponse(status=200, text=json.dumps(payload), duration_ms=1.0)
+    resp = GraphQLResponse(status=200, body=json.dumps(payload).encode(), duration_ms=1.0)
     result = build_introspection_result(resp)
     assert result.success is False
     assert "GraphQL errors" in result.status
@@ -66,21 +76,21 @@ def test_build_introspection_result_errors_field():
 
 def test_build_introspection_result_missing_types():
     payload = {"data": {"__schema": {"types": []}}}
-    resp = GraphQLResponse(status=200, text=json.dumps(payload), duration_ms=1.0)
+    resp = GraphQLResponse(status=200, body=json.dumps(payload).encode(), duration_ms=1.0)
     result = build_introspection_result(resp)
     assert result.success is False
     assert "No types returned" in result.status or "Schema loaded but no object" in result.status
 
 
 def test_build_introspection_result_bad_json():
-    resp = GraphQLResponse(status=200, text="{not json", duration_ms=1.0)
+    resp = GraphQLResponse(status=200, body=b"{not json", duration_ms=1.0)
     result = build_introspection_result(resp)
     assert result.success is False
     assert "Could not parse JSON" in result.status
 
 
 def test_build_introspection_result_http_error():
-    resp = GraphQLResponse(status=500, text="fail", duration_ms=1.0)
+    resp = GraphQLResponse(status=500, body=b"fail", duration_ms=1.0)
     result = build_introspection_result(resp)
     assert result.success is False
     assert "HTTP 500" in result.status
@@ -97,10 +107,51 @@ def test_add_types_to_tree():
             }
         }
     }
-    resp = GraphQLResponse(status=200, text=json.dumps(payload), duration_ms=1.0)
+    resp = GraphQLResponse(status=200, body=json.dumps(payload).encode(), duration_ms=1.0)
     result = build_introspection_result(resp)
     tree = _Tree()
     added = add_types_to_tree(tree, result.types)
     assert added == 1
-    assert tree.root.children[0].label.startswith("Query")
-    assert tree.root.children[0].children[0].data["type"] == "String"
+    type_node = tree.root.children[0]
+    assert type_node.label.startswith("Query")
+    assert type_node.children == []
+    assert expand_tree_node(type_node) == 1
+    assert type_node.children[0].data.type_repr == "String"
+    assert expand_tree_node(type_node) == 0
+
+
+def test_add_types_to_tree_buckets_large_schemas():
+    types = [TypeInfo(name=f"{letter}Type{i}", kind="OBJECT") for i in range(BUCKET_THRESHOLD) for letter in "Az"]
+    tree = _Tree()
+    assert add_types_to_tree(tree, types) == len(types)
+    labels = [node.label for node in tree.root.children]
+    assert labels == [f"A-D ({BUCKET_THRESHOLD})", f"Y-Z ({BUCKET_THRESHOLD})"]
+    bucket = tree.root.children[1]
+    assert expand_tree_node(bucket) == BUCKET_THRESHOLD
+    assert bucket.children[0].label == "zType0 (object)"
+
+
+def test_build_introspection_result_reuses_cached_result():
+    payload = {"data": {"__schema": {"types": [{"name": "Query", "kind": "OBJECT", "fields": []}]}}}
+    text = json.dumps(payload)
+    first = build_introspection_result(GraphQLResponse(status=200, body=text.encode(), duration_ms=1.0))
+    second = build_introspection_result(GraphQLResponse(status=200, body=text.encode(), duration_ms=2.0))
+    assert first.success is True
+    assert second is first
+
+
+def test_type_repr_shares_rendered_wrappers():
+    def ref():
+        return {"kind": "NON_NULL", "ofType": {"kind": "LIST", "ofType": {"kind": "SCALAR", "name": "ID"}}}
+
+    cache: dict = {}
+    first = _type_repr(ref(), cache)
+    assert first == "[ID]!"
+    assert _type_repr(ref(), cache) is first
+    assert _type_repr({"kind": "SCALAR", "name": "Int"}, cache) == "Int"
+
+
+def test_format_node_details_for_field():
+    field = FieldInfo(name="user", type_repr="User!", description="Look up a user.", args_str="id: ID!")
+    assert format_node_details(field) == "**Type**: User!\n\n**Args**: id: ID!\n\nLook up a user."
+    assert format_node_details(None) == ""
@@ -0,0 +1,34 @@
+# ruff: noqa: S101
+import os
+
+import pytest
+
+from voyager import introspection_cache
+
+
+@pytest.fixture
+def tmp_cache_dir(tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    monkeypatch.setenv("HTTP_VOYAGER_CACHE_DIR", str(cache))
+    return cache
+
+
+def test_get_returns_none_when_missing(tmp_cache_dir):
+    assert introspection_cache.get("https://example.com/graphql", {}) is None
+
+
+def test_put_and_get_roundtrip(tmp_cache_dir):
+    headers = {"Authorization": "token", "Content-Type": "application/json"}
+    introspection_cache.put("https://example.com/graphql", headers, b'{"data": {}}')
+
+    reordered = {"content-type": "application/json", "authorization": "token"}
+    assert introspection_cache.get("https://example.com/graphql", reordered) == b'{"data": {}}'
+    assert introspection_cache.get("https://example.com/graphql", {"Authorization": "other"}) is None
+
+
+def test_get_skips_expired_entries(tmp_cache_dir):
+    introspection_cache.put("https://example.com/graphql", {}, b"{}")
+    path = next(tmp_cache_dir.iterdir())
+    os.utime(path, (0, 0))
+
+    assert introspection_cache.get("https://example.com/graphql", {}) is None
@@ -1,14 +1,27 @@
 # ruff: noqa: S101
 import pytest
 
+from voyager import _json
 from voyager.models import GraphQLResponse
-from voyager.parsing import format_response, parse_headers, parse_json_object
+from voyager.parsing import LastInputCache, format_response, parse_headers, parse_json_object
 
 
 def test_parse_json_object_valid():
     assert parse_json_object('{"a": 1}') == {"a": 1}
 
 
+def test_parse_json_object_keeps_big_integers_exact():
+    big = 123456789012345678901234567890
+    assert parse_json_object(f'{{"a": {big}}}') == {"a": big}
+    assert _json.loads_exact(_json.dumps({"a": big}).decode()) == {"a": big}
+
+
+def test_dumps_is_compact_without_orjson(monkeypatch):
+    monkeypatch.setattr(_json, "orjson", None)
+    assert _json.dumps({"a": [1, 2]}) == b'{"a":[1,2]}'
+    assert _json.dumps({"a": 1}, indent=True) == b'{\n  "a": 1\n}'
+
+
 def test_parse_json_object_non_object():
     with pytest.raises(ValueError, match="Expected a JSON object"):
         parse_json_object('["a", "b"]')
@@ -29,14 +42,35 @@ def test_parse_headers_invalid_line():
         parse_headers("NoColonHere")
 
 
+def test_parse_headers_skips_blank_lines_and_rejects_empty_names():
+    assert parse_headers("A: 1\n\n  \nB:2:3") == {"A": "1", "B": "2:3"}
+    with pytest.raises(ValueError, match="Invalid header line"):
+        parse_headers("A: 1\n: orphan")
+
+
+def test_last_input_cache_reparses_only_changed_text():
+    calls = []
+
+    def parse(raw):
+        calls.append(raw)
+        return parse_headers(raw)
+
+    cached = LastInputCache(parse)
+    first = cached("A: 1")
+    first["Content-Type"] = "application/json"
+    assert cached("A: 1") == {"A": "1"}
+    assert cached("A: 2") == {"A": "2"}
+    assert calls == ["A: 1", "A: 2"]
+
+
 def test_format_response_json_body():
-    resp = GraphQLResponse(status=200, text='{"ok":true}', duration_ms=12.3)
+    resp = GraphQLResponse(status=200, body=b'{"ok":true}', duration_ms=12.3)
     formatted = format_response(resp)
     assert "Status: 200" in formatted
     assert '"ok": true' in formatted
 
 
 def test_format_response_plain_text():
-    resp = GraphQLResponse(status=500, text="boom", duration_ms=1.0)
+    resp = GraphQLResponse(status=500, body=b"boom", duration_ms=1.0)
     formatted = format_response(resp)
     assert "boom" in formatted
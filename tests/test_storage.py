@@ -1,7 +1,12 @@
 # ruff: noqa: S101
+import asyncio
+import threading
 
+import pytest
+
+from voyager import storage
 from voyager.models import GraphQLTabSpec
-from voyager.storage import _config_path, load_last_state, save_state
+from voyager.storage import StateSaver, StateStore, _config_path, load_last_state, save_state
 
 
 def _make_spec(endpoint: str) -> GraphQLTabSpec:
@@ -38,3 +43,99 @@ def test_load_handles_broken_json(tmp_config_dir):
     spec = _make_spec("http://default")
     loaded = load_last_state(spec, section="graphql")
     assert loaded.endpoint == "http://default"
+
+
+def test_save_state_writes_compact_json_unless_pretty(tmp_config_dir, monkeypatch):
+    save_state(_make_spec("http://saved"), section="graphql")
+    assert b"\n" not in _config_path().read_bytes()
+    monkeypatch.setenv("HTTP_VOYAGER_PRETTY", "1")
+    save_state(_make_spec("http://saved"), section="graphql")
+    assert b'\n  "graphql"' in _config_path().read_bytes()
+
+
+def test_save_state_leaves_no_temp_file(tmp_config_dir):
+    save_state(_make_spec("http://saved"), section="graphql")
+    assert sorted(p.name for p in tmp_config_dir.iterdir()) == ["state.json"]
+
+
+def test_config_path_follows_env_changes(tmp_config_dir, tmp_path, monkeypatch):
+    assert _config_path() == tmp_config_dir / "state.json"
+    assert _config_path() is _config_path()
+    monkeypatch.setenv("HTTP_VOYAGER_CONFIG_DIR", str(tmp_path / "other"))
+    assert _config_path() == tmp_path / "other" / "state.json"
+
+
+@pytest.mark.asyncio
+async def test_state_saver_coalesces_bursts():
+    saved = []
+    saver = StateSaver(saved.append, delay=0)
+    for endpoint in ("http://a", "http://b", "http://c"):
+        saver.schedule(_make_spec(endpoint))
+    for _ in range(100):
+        if saved:
+            break
+        await asyncio.sleep(0.01)
+    assert [spec.endpoint for spec in saved] == ["http://c"]
+
+
+@pytest.mark.asyncio
+async def test_state_saver_flush_lands_after_in_flight_write():
+    saved = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_save(spec):
+        if spec.endpoint == "http://old":
+            started.set()
+            release.wait(5)
+        saved.append(spec.endpoint)
+
+    saver = StateSaver(slow_save, delay=0)
+    saver.schedule(_make_spec("http://old"))
+    while not started.is_set():
+        await asyncio.sleep(0.01)
+    saver.schedule(_make_spec("http://new"))
+    threading.Timer(0.05, release.set).start()
+    saver.flush()
+    await asyncio.sleep(0.05)
+
+    assert saved == ["http://old", "http://new"]
+
+
+@pytest.mark.asyncio
+async def test_state_saver_flush_saves_pending_and_reports_errors():
+    errors = []
+
+    def failing_save(spec):
+        raise OSError("read-only")
+
+    saver = StateSaver(failing_save, on_error=errors.append, delay=60)
+    saver.schedule(_make_spec("http://a"))
+    saver.flush()
+    assert [str(exc) for exc in errors] == ["read-only"]
+
+
+def test_save_state_skips_unchanged_payload(tmp_config_dir, monkeypatch):
+    save_state(_make_spec("http://saved"), section="graphql")
+    writes = []
+    monkeypatch.setattr(storage, "_write_atomic", lambda path, blob: writes.append(blob))
+    save_state(_make_spec("http://saved"), section="graphql")
+    assert writes == []
+    save_state(_make_spec("http://changed"), section="graphql")
+    assert len(writes) == 1
+
+
+def test_state_store_reads_file_once(tmp_config_dir, monkeypatch):
+    save_state(_make_spec("http://saved"), section="graphql")
+    reads = []
+    read_state = storage._read_state
+    monkeypatch.setattr(storage, "_read_state", lambda path: reads.append(path) or read_state(path))
+
+    store = StateStore()
+    assert store.load(_make_spec("http://default"), section="graphql").endpoint == "http://saved"
+    store.save(_make_spec("http://new"), section="graphql")
+    store.save(_make_spec("http://http"), section="http")
+    assert store.load(_make_spec("http://default"), section="graphql").endpoint == "http://new"
+    assert len(reads) == 1
+
+    assert load_last_state(_make_spec("http://default"), section="http").endpoint == "http://http"
@@ -1,8 +1,10 @@
 # ruff: noqa: S101
 import asyncio
+from types import SimpleNamespace
 
 import pytest
 
+from voyager import ws_tab
 from voyager.models import WebSocketTabSpec
 from voyager.ws_tab import WebSocketTab
 
@@ -19,11 +21,8 @@ class StubVal:
 class DummyTask:
     def __init__(self, coro):
         self.coro = coro
-        try:
-            coro.close()
-        except Exception as exc:  # pragma: no cover - defensive cleanup
-            # Log or swallow cleanup issues during test scaffolding.
-            DummyTask._last_error = exc
+        # The coroutine was never started, so close() just marks it finished.
+        coro.close()
 
     def cancel(self):
         return None
@@ -64,7 +63,7 @@ class TestableWebSocketTab(WebSocketTab):
     def _append_log(self, message: str) -> None:
         self.logs.append(message)
 
-    def _persist_state(self) -> None:
+    def _persist_state(self, spec: WebSocketTabSpec) -> None:
         self.saved = True
 
 
@@ -96,3 +95,211 @@ async def test_connect_invalid_endpoint_sets_status(monkeypatch, ws_connect_stub
 
     assert tab.connected is False
     assert any("Unsupported URL scheme" in status for status in tab.statuses)
+
+
+class StubLog(StubVal):
+    def __init__(self) -> None:
+        super().__init__()
+        self.loads = 0
+        self.document = self
+        self.history = SimpleNamespace(clear=lambda: None)
+
+    @property
+    def end(self) -> tuple[int, int]:
+        lines = self.text.split("\n")
+        return len(lines) - 1, len(lines[-1])
+
+    def load_text(self, text: str) -> None:
+        super().load_text(text)
+        self.loads += 1
+
+    def insert(self, text: str, location: tuple[int, int]) -> None:
+        assert location == self.end
+        self.text += text
+
+
+class LogTab(WebSocketTab):
+    __test__ = False
+
+    def __init__(self) -> None:
+        super().__init__(WebSocketTabSpec(id="ws", title="WS", url="wss://echo.example"))
+        self.log_widget = StubLog()
+        self.timers: list = []
+
+    def _textarea(self, name: str):
+        return self.log_widget
+
+    def set_timer(self, delay, callback):
+        self.timers.append(callback)
+
+
+def test_append_log_batches_until_flush():
+    tab = LogTab()
+
+    tab._append_log("one")
+    tab._append_log("two")
+
+    assert len(tab.timers) == 1
+    assert tab.log_widget.text == ""
+
+    tab.timers[0]()
+    tab._append_log("three")
+    tab.timers[1]()
+
+    assert tab.log_widget.text == "one\ntwo\nthree"
+    assert tab.log_widget.loads == 0
+
+
+def test_log_keeps_only_newest_lines():
+    class SmallLogTab(LogTab):
+        LOG_MAX_LINES = 2
+
+    tab = SmallLogTab()
+    for line in ("one", "two", "three"):
+        tab._append_log(line)
+    tab.timers[0]()
+
+    assert tab.log_widget.text == "two\nthree"
+
+
+@pytest.mark.asyncio
+async def test_recv_loop_logs_frames_up_to_line_cap(ws_connect_stub):
+    class SmallLogTab(LogTab):
+        LOG_MAX_LINES = 2
+
+    tab = SmallLogTab()
+    tab.connected = True
+    socket = ws_connect_stub.socket
+    for frame in ("one", "two", "three"):
+        socket.push(frame)
+
+    task = asyncio.create_task(tab._recv_loop(socket))
+    await asyncio.sleep(0)
+    task.cancel()
+    await task
+    tab.timers[0]()
+
+    assert tab.log_widget.text == "Received: two\nReceived: three"
+    assert tab.connected is False
+
+
+def test_connect_params_are_inspected_once():
+    ws_tab._ws_connect_params.cache_clear()
+
+    ws_tab._connect_kwargs({}, verify_tls=True, scheme="wss")
+    ws_tab._connect_kwargs({"A": "b"}, verify_tls=False, scheme="wss")
+
+    assert ws_tab._ws_connect_params.cache_info().misses == 1
+
+
+def test_connect_kwargs_reuse_ssl_context():
+    first = ws_tab._connect_kwargs({}, verify_tls=True, scheme="wss")["ssl"]
+    second = ws_tab._connect_kwargs({}, verify_tls=True, scheme="wss")["ssl"]
+
+    assert first is second
+    assert ws_tab._connect_kwargs({}, verify_tls=False, scheme="wss")["ssl"] is not first
+
+
+@pytest.mark.asyncio
+async def test_spawn_skips_while_same_action_is_running():
+    spec = WebSocketTabSpec(id="ws", title="WS", url="wss://echo.example")
+    tab = TestableWebSocketTab(spec, endpoint="wss://echo.example", headers="", verify=True)
+    release = asyncio.Event()
+    runs: list[int] = []
+
+    async def action() -> None:
+        runs.append(1)
+        await release.wait()
+
+    tab._spawn("connect", action)
+    tab._spawn("connect", action)
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert runs == [1]
+    assert tab._pending == {}
+
+
+@pytest.mark.asyncio
+async def test_first_connect_skips_disconnect(monkeypatch, ws_connect_stub):
+    spec = WebSocketTabSpec(id="ws", title="WS", url="wss://echo.example")
+    tab = TestableWebSocketTab(spec, endpoint="wss://echo.example", headers="", verify=True)
+    monkeypatch.setattr(asyncio, "create_task", lambda coro: DummyTask(coro))
+    disconnects: list[int] = []
+
+    async def fake_disconnect() -> None:
+        disconnects.append(1)
+
+    monkeypatch.setattr(tab, "disconnect", fake_disconnect)
+
+    await tab.connect(ws_connect=ws_connect_stub)
+
+    assert disconnects == []
+    assert tab.connected is True
+
+
+@pytest.mark.asyncio
+async def test_send_without_connection_does_not_connect(ws_connect_stub):
+    spec = WebSocketTabSpec(id="ws", title="WS", url="wss://echo.example")
+    tab = TestableWebSocketTab(spec, endpoint="wss://echo.example", headers="", verify=True)
+    tab.ws_connect = ws_connect_stub
+
+    await tab.send()
+
+    assert ws_connect_stub.calls == []
+    assert tab.statuses[-1] == "Not connected."
+
+
+def test_resolve_connector_prefers_connect_attribute(ws_connect_stub):
+    async def bare(endpoint: str, **kwargs):
+        return None
+
+    assert ws_tab._resolve_connector(ws_connect_stub) == ws_connect_stub.connect
+    assert ws_tab._resolve_connector(bare) is bare
+    assert ws_tab._resolve_connector(None) is None
+
+
+def test_connect_kwargs_skip_ssl_for_plain_ws():
+    assert "ssl" not in ws_tab._connect_kwargs({}, verify_tls=True, scheme="ws")
+
+
+@pytest.mark.asyncio
+async def test_log_appends_cannot_be_undone():
+    from textual.app import App
+
+    tab = WebSocketTab(WebSocketTabSpec(id="ws", title="WS", url="wss://echo.example"))
+
+    class LogApp(App):
+        def compose(self):
+            yield tab
+
+    async with LogApp().run_test() as pilot:
+        tab._append_log("one")
+        tab._flush_log()
+        tab._append_log("two")
+        tab._flush_log()
+        log = tab._textarea("log")
+        log.focus()
+        await pilot.press("ctrl+z")
+
+        assert log.text == "one\ntwo"
+
+
+@pytest.mark.asyncio
+async def test_unmount_cancels_in_flight_connect():
+    spec = WebSocketTabSpec(id="ws", title="WS", url="wss://echo.example")
+    tab = TestableWebSocketTab(spec, endpoint="wss://echo.example", headers="", verify=True)
+    opened: list[int] = []
+
+    async def slow_connect() -> None:
+        await asyncio.sleep(60)
+        opened.append(1)
+
+    tab._spawn("connect", slow_connect)
+    await asyncio.sleep(0)
+    await tab.on_unmount()
+
+    assert opened == []
+    assert tab._pending == {}
@@ -0,0 +1,49 @@
+"""JSON helpers that prefer orjson and fall back to the standard library."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one name covers both parsers.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(raw: str | bytes) -> Any:
+    """Parse a JSON document from text or raw UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def loads_exact(raw: str) -> Any:
+    """Parse JSON the user typed with the standard library.
+
+    orjson turns integers wider than 64 bits into floats and rejects NaN/Infinity; the
+    standard library keeps such values as written.
+    """
+    return json.loads(raw)
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, optionally indented with two spaces."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+        except TypeError:
+            pass  # e.g. an integer wider than 64 bits; the standard library encodes it exactly
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_indent(obj: Any) -> str:
+    """Serialize to JSON text indented with two spaces."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2)
@@ -0,0 +1,15 @@
+"""TLS settings shared by the HTTP client and the WebSocket tab."""
+
+import functools
+import ssl
+
+
+@functools.lru_cache(maxsize=2)
+def ssl_context(verify_tls: bool) -> ssl.SSLContext:
+    """Return the context for this verification mode; built once, since loading the CA bundle is slow."""
+    # A context is safe to share between connections.
+    context = ssl.create_default_context()
+    if not verify_tls:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    return context
@@ -1,5 +1,5 @@
 import os
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from importlib.resources import files
 
 from textual.app import App, ComposeResult
@@ -8,16 +8,29 @@ from textual.containers import Container
 from textual.widgets import Footer, Header, TabbedContent
 
 from .config import DEFAULT_HTTP_TAB, DEFAULT_TABS, DEFAULT_WS_TAB
+from .http_client import aclose_clients
 from .models import GraphQLTabSpec, HttpTabSpec, WebSocketTabSpec
-from .storage import load_last_state, save_state
+from .storage import StateStore
 from .tabs import GraphQLTab, HttpTab
 from .ws_tab import WebSocketTab
 
 
+def _first_spec(tab_specs: Sequence[GraphQLTabSpec] | GraphQLTabSpec) -> GraphQLTabSpec:
+    if isinstance(tab_specs, GraphQLTabSpec):  # subclasses miss the exact-type lookup
+        return tab_specs
+    return tab_specs[0] if tab_specs else DEFAULT_TABS[0]
+
+
+_SPEC_NORMALIZERS: dict[type, Callable[[object], GraphQLTabSpec]] = {
+    type(None): lambda _: DEFAULT_TABS[0],
+    GraphQLTabSpec: lambda spec: spec,  # type: ignore[return-value]
+}
+
+
 class GraphQLVoyager(App[None]):
     """A tabbed console GraphQL client built with Textual."""
 
-    CSS = files("voyager.ui_components").joinpath("styles/main.tcss").read_text()
+    CSS = files("voyager.ui_components").joinpath("styles/main.tcss").read_bytes().decode("utf-8")
 
     BINDINGS = [
         Binding("ctrl+s", "send", "Send request"),
@@ -40,9 +53,11 @@ class GraphQLVoyager(App[None]):
         if config_dir:
             os.environ["HTTP_VOYAGER_CONFIG_DIR"] = config_dir
         base_spec = self._normalize_spec(tab_specs)
-        self.tab_spec = load_last_state(base_spec, section="graphql")
-        self.http_spec = load_last_state(DEFAULT_HTTP_TAB, section="http")
-        self.ws_spec = load_last_state(DEFAULT_WS_TAB, section="websocket")
+        # state.json is read once here; later saves update this copy and write through.
+        self._state_store = StateStore()
+        self.tab_spec = self._state_store.load(base_spec, section="graphql")
+        self.http_spec = self._state_store.load(DEFAULT_HTTP_TAB, section="http")
+        self.ws_spec = self._state_store.load(DEFAULT_WS_TAB, section="websocket")
         self.view: GraphQLTab | None = None
         self.http_view: HttpTab | None = None
         self.ws_view: WebSocketTab | None = None
@@ -63,6 +78,9 @@ class GraphQLVoyager(App[None]):
         if self.view:
             self.view.focus_query()
 
+    async def on_unmount(self) -> None:
+        await aclose_clients()
+
     async def action_send(self) -> None:
         tab = self._active_tab()
         if isinstance(tab, (GraphQLTab, HttpTab, WebSocketTab)):
@@ -80,20 +98,14 @@ class GraphQLVoyager(App[None]):
 
     def save_state(self, spec: GraphQLTabSpec | HttpTabSpec | WebSocketTabSpec, section: str) -> None:
         try:
-            save_state(spec, section)
+            self._state_store.save(spec, section)
         except Exception:
             # Silently ignore persistence failures; UI status is handled in view.
             return
 
     @staticmethod
     def _normalize_spec(tab_specs: Sequence[GraphQLTabSpec] | GraphQLTabSpec | None) -> GraphQLTabSpec:
-        if tab_specs is None:
-            return DEFAULT_TABS[0]
-        if isinstance(tab_specs, GraphQLTabSpec):
-            return tab_specs
-        if not tab_specs:
-            return DEFAULT_TABS[0]
-        return tab_specs[0]
+        return _SPEC_NORMALIZERS.get(type(tab_specs), _first_spec)(tab_specs)  # type: ignore[arg-type]
 
     def _active_tab(self):
         tabs = self.query_one("#tabs", TabbedContent)
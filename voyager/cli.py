@@ -4,7 +4,6 @@ import argparse
 import logging
 from collections.abc import Sequence
 
-from .app import GraphQLVoyager
 from .logging_setup import configure_logging
 
 logger = logging.getLogger(__name__)
@@ -25,4 +24,8 @@ def main(argv: Sequence[str] | None = None) -> None:
     log_path = configure_logging(args.debug)
     if args.debug and log_path is None:
         logger.warning("Debug logging requested but log file could not be created.")
+
+    # Imported here so `--help` and argument errors don't pay for loading Textual.
+    from .app import GraphQLVoyager
+
     GraphQLVoyager().run()
@@ -1,7 +1,7 @@
 import asyncio
-import json
-import ssl
 from collections.abc import Awaitable, Callable
+from time import perf_counter
+from typing import Any
 from urllib import request
 from urllib.parse import urlparse
 
@@ -10,52 +10,67 @@ try:
 except Exception:  # pragma: no cover - httpx is optional
     httpx = None  # type: ignore
 
+from . import _json, _tls
 from .models import GraphQLResponse
 
+_ALLOWED_PREFIXES = ("http://", "https://")
+# Shared httpx clients keyed by verify_tls, with the event loop each was created on.
+_clients: dict[bool, tuple[asyncio.AbstractEventLoop, Any]] = {}
+# Canonical method names keyed by their upper- and lowercase spellings.
+_METHODS = {
+    spelling: name
+    for name in ("GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS")
+    for spelling in (name, name.lower())
+}
+
 
 async def perform_request(
     endpoint: str,
-    payload: dict,
+    payload: dict | bytes,
     headers: dict[str, str],
     verify_tls: bool,
-    requester: Callable[[str, dict, dict[str, str], bool], Awaitable[tuple[int, str]]] | None = None,
+    requester: Callable[[str, dict | bytes, dict[str, str], bool], Awaitable[tuple[int, str | bytes]]] | None = None,
     client_factory: Callable[[], Awaitable[object] | object] | None = None,
 ) -> GraphQLResponse:
     _validate_url(endpoint)
-    start = asyncio.get_event_loop().time()
+    if isinstance(payload, bytes) and "Content-Type" not in headers:
+        # httpx only sets it for json=; copied so the caller's dict is left alone.
+        headers = {**headers, "Content-Type": "application/json"}
+    start = perf_counter()
+    encoding = None
     if requester is not None:
-        status, text = await requester(endpoint, payload, headers, verify_tls)
+        status, content = await requester(endpoint, payload, headers, verify_tls)
     elif httpx is not None:
-        status, text = await _httpx_post(endpoint, payload, headers, verify_tls, client_factory)
+        status, content, encoding = await _httpx_post(endpoint, payload, headers, verify_tls, client_factory)
     else:
-        status, text = await asyncio.to_thread(_urllib_post, endpoint, payload, headers, verify_tls)
-    elapsed = (asyncio.get_event_loop().time() - start) * 1000
-    return GraphQLResponse(status=status, text=text, duration_ms=elapsed)
+        status, content, encoding = await asyncio.to_thread(_urllib_post, endpoint, payload, headers, verify_tls)
+    elapsed = (perf_counter() - start) * 1000
+    return GraphQLResponse(status=status, body=_as_bytes(content), duration_ms=elapsed, encoding=encoding)
 
 
 async def _httpx_post(
     endpoint: str,
-    payload: dict,
+    payload: dict | bytes,
     headers: dict[str, str],
     verify_tls: bool,
     client_factory: Callable[[], Awaitable[object]] | None = None,
-) -> tuple[int, str]:
+) -> tuple[int, bytes, str | None]:
     if httpx is None:  # pragma: no cover - guarded by perform_request
         raise RuntimeError("httpx is not installed.")
-    if client_factory:
-        client = client_factory()
-        if asyncio.iscoroutine(client):
-            client = await client
-        resp = await client.post(endpoint, json=payload, headers=headers)
-        return resp.status_code, resp.text
-    async with httpx.AsyncClient(timeout=20, verify=verify_tls) as client:
-        resp = await client.post(endpoint, json=payload, headers=headers)
-        return resp.status_code, resp.text
+    client = await _client_for(verify_tls, client_factory)
+    resp = await client.post(endpoint, headers=headers, **_post_body(payload))
+    return resp.status_code, resp.content, resp.encoding
 
 
-def _urllib_post(endpoint: str, payload: dict, headers: dict[str, str], verify_tls: bool) -> tuple[int, str]:
-    _validate_url(endpoint)
-    body = json.dumps(payload)
+def _post_body(payload: dict | bytes) -> dict[str, Any]:
+    # Pre-serialized JSON skips httpx's encoder; perform_request has set Content-Type.
+    return {"content": payload} if isinstance(payload, bytes) else {"json": payload}
+
+
+def _urllib_post(
+    endpoint: str, payload: dict | bytes, headers: dict[str, str], verify_tls: bool
+) -> tuple[int, bytes, str | None]:
+    body = payload if isinstance(payload, bytes) else _json.dumps(payload)
     return _urllib_request("POST", endpoint, headers, body, verify_tls)
 
 
@@ -65,74 +80,115 @@ async def perform_http_request(
     headers: dict[str, str],
     body: str | None,
     verify_tls: bool,
-    requester: Callable[[str, str, dict[str, str], str | None, bool], Awaitable[tuple[int, str]]] | None = None,
+    requester: Callable[[str, str, dict[str, str], str | None, bool], Awaitable[tuple[int, str | bytes]]] | None = None,
     client_factory: Callable[[], Awaitable[object] | object] | None = None,
 ) -> GraphQLResponse:
-    normalized_method = method.strip().upper() or "GET"
+    normalized_method = _METHODS.get(method) or method.strip().upper() or "GET"
     _validate_url(endpoint)
-    start = asyncio.get_event_loop().time()
+    start = perf_counter()
+    encoding = None
     if requester is not None:
-        status, text = await requester(endpoint, normalized_method, headers, body, verify_tls)
-    elif httpx is not None:
-        status, text = await _httpx_request(endpoint, normalized_method, headers, body, verify_tls, client_factory)
+        status, content = await requester(endpoint, normalized_method, headers, body, verify_tls)
     else:
-        status, text = await asyncio.to_thread(_urllib_request, normalized_method, endpoint, headers, body, verify_tls)
-    elapsed = (asyncio.get_event_loop().time() - start) * 1000
-    return GraphQLResponse(status=status, text=text, duration_ms=elapsed)
+        # Encoded once here; both transports send the bytes as-is.
+        data = body.encode("utf-8") if body else None
+        if httpx is not None:
+            status, content, encoding = await _httpx_request(
+                endpoint, normalized_method, headers, data, verify_tls, client_factory
+            )
+        else:
+            status, content, encoding = await asyncio.to_thread(
+                _urllib_request, normalized_method, endpoint, headers, data, verify_tls
+            )
+    elapsed = (perf_counter() - start) * 1000
+    return GraphQLResponse(status=status, body=_as_bytes(content), duration_ms=elapsed, encoding=encoding)
 
 
 async def _httpx_request(
     endpoint: str,
     method: str,
     headers: dict[str, str],
-    body: str | None,
+    body: bytes | None,
     verify_tls: bool,
     client_factory: Callable[[], Awaitable[object] | object] | None = None,
-) -> tuple[int, str]:
+) -> tuple[int, bytes, str | None]:
     if httpx is None:  # pragma: no cover - guarded by perform_http_request
         raise RuntimeError("httpx is not installed.")
+    client = await _client_for(verify_tls, client_factory)
+    resp = await client.request(
+        method=method,
+        url=endpoint,
+        content=body,
+        headers=headers,
+    )
+    return resp.status_code, resp.content, resp.encoding
+
+
+async def _client_for(verify_tls: bool, client_factory: Callable[[], Awaitable[object] | object] | None) -> Any:
     if client_factory:
         client = client_factory()
         if asyncio.iscoroutine(client):
             client = await client
-        resp = await client.request(
-            method=method,
-            url=endpoint,
-            content=body.encode("utf-8") if body else None,
-            headers=headers,
-        )
-        return resp.status_code, resp.text
-    async with httpx.AsyncClient(timeout=20, verify=verify_tls) as client:
-        resp = await client.request(
-            method=method,
-            url=endpoint,
-            content=body.encode("utf-8") if body else None,
-            headers=headers,
-        )
-        return resp.status_code, resp.text
+        return client
+    return await _shared_client(verify_tls)
+
+
+async def _shared_client(verify_tls: bool) -> Any:
+    """Return the process-wide client for this TLS mode, so connections are kept alive between requests."""
+    loop = asyncio.get_running_loop()
+    entry = _clients.get(verify_tls)
+    if entry is not None and entry[0] is loop and not entry[1].is_closed:
+        return entry[1]
+    # A client's pool is bound to the loop it was used on; start fresh if the loop changed.
+    # The replacement is stored before awaiting, so concurrent callers don't each make one.
+    client = httpx.AsyncClient(timeout=20, verify=verify_tls, limits=httpx.Limits(max_keepalive_connections=16))
+    _clients[verify_tls] = (loop, client)
+    if entry is not None:
+        await _retire_client(*entry)
+    return client
+
+
+async def _retire_client(loop: asyncio.AbstractEventLoop, client: Any) -> None:
+    """Close a replaced shared client so its connection pool is not leaked."""
+    if client.is_closed:
+        return
+    if loop.is_running() and loop is not asyncio.get_running_loop():
+        # Still serving another thread; close it there.
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        return
+    try:
+        await client.aclose()
+    except RuntimeError:
+        # Its loop is closed, so the sockets can't be shut down through it. aclose() has
+        # still marked the client closed and emptied its pool, dropping the connections.
+        pass
+
+
+async def aclose_clients() -> None:
+    """Close the shared httpx clients; call once on application shutdown."""
+    entries = list(_clients.values())
+    _clients.clear()
+    for _, client in entries:
+        await client.aclose()
 
 
 def _urllib_request(
-    method: str, endpoint: str, headers: dict[str, str], body: str | None, verify_tls: bool
-) -> tuple[int, str]:
-    _validate_url(endpoint)
-    data = body.encode("utf-8") if body else None
-    req = request.Request(endpoint, data=data, headers=headers, method=method)  # noqa: S310 - scheme validated above
-    context = _ssl_context(verify_tls)
-    with request.urlopen(req, timeout=20, context=context) as resp:  # noqa: S310 - scheme validated above
-        text = resp.read().decode("utf-8", errors="replace")
-        return resp.status, text
+    method: str, endpoint: str, headers: dict[str, str], body: bytes | None, verify_tls: bool
+) -> tuple[int, bytes, str | None]:
+    # The scheme was already checked by perform_request / perform_http_request.
+    req = request.Request(endpoint, data=body or None, headers=headers, method=method)  # noqa: S310 - scheme validated by caller
+    context = _tls.ssl_context(verify_tls)
+    with request.urlopen(req, timeout=20, context=context) as resp:  # noqa: S310 - scheme validated by caller
+        return resp.status, resp.read(), resp.headers.get_content_charset()
 
 
-def _ssl_context(verify_tls: bool) -> ssl.SSLContext:
-    context = ssl.create_default_context()
-    if not verify_tls:
-        context.check_hostname = False
-        context.verify_mode = ssl.CERT_NONE
-    return context
+def _as_bytes(content: str | bytes) -> bytes:
+    return content.encode("utf-8") if isinstance(content, str) else content
 
 
 def _validate_url(endpoint: str) -> None:
-    parsed = urlparse(endpoint)
-    if parsed.scheme not in {"http", "https"}:
-        raise ValueError(f"Unsupported URL scheme: {parsed.scheme or 'missing'}")
+    # Schemes are case-insensitive; only lowercase the prefix when the fast check misses.
+    if endpoint.startswith(_ALLOWED_PREFIXES) or endpoint[:8].lower().startswith(_ALLOWED_PREFIXES):
+        return
+    scheme = urlparse(endpoint).scheme
+    raise ValueError(f"Unsupported URL scheme: {scheme or 'missing'}")
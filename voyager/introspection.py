@@ -1,15 +1,45 @@
 from __future__ import annotations
 
-import json
-from collections.abc import Iterable
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from dataclasses import field as dc_field
 from typing import Any
 
+from . import _json
 from .models import GraphQLResponse
 
+# Only what the explorer shows: argument descriptions are never displayed, so they are
+# not requested. Type and field descriptions are shown when a node is selected.
+INTROSPECTION_QUERY = """
+query IntrospectionQuery {
+  __schema {
+    types {
+      kind
+      name
+      description
+      fields(includeDeprecated: true) {
+        name
+        description
+        args {
+          name
+          type { kind name ofType { kind name ofType { kind name } } }
+        }
+        type { kind name ofType { kind name ofType { kind name } } }
+      }
+    }
+  }
+}
+"""
 
-@dataclass
+# The introspection request never changes, so it is serialized once at import.
+INTROSPECTION_BODY = _json.dumps({"query": INTROSPECTION_QUERY, "variables": {}})
+
+
+@dataclass(slots=True)
 class FieldInfo:
     name: str
     type_repr: str
@@ -17,7 +47,7 @@ class FieldInfo:
     args_str: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeInfo:
     name: str
     kind: str
@@ -25,7 +55,7 @@ class TypeInfo:
     fields: list[FieldInfo] = dc_field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IntrospectionResult:
     success: bool
     status: str
@@ -33,27 +63,62 @@ class IntrospectionResult:
     types: list[TypeInfo] = dc_field(default_factory=list)
 
 
+_TYPE_KINDS = frozenset({"OBJECT", "INTERFACE", "INPUT_OBJECT"})
+
+# Above this many types the tree groups them into alphabetical buckets (A-D, E-H, ...).
+BUCKET_THRESHOLD = 500
+_BUCKET_LABELS = ("A-D", "E-H", "I-L", "M-P", "Q-T", "U-X", "Y-Z")
+_BUCKET_BY_LETTER = {chr(code): label for label in _BUCKET_LABELS for code in range(ord(label[0]), ord(label[-1]) + 1)}
+
+RESULT_CACHE_SIZE = 8
+_result_cache: OrderedDict[str, IntrospectionResult] = OrderedDict()
+# The tabs call build_introspection_result from worker threads.
+_result_cache_lock = threading.Lock()
+
+
 def build_introspection_result(response: GraphQLResponse) -> IntrospectionResult:
-    """Parse introspection HTTP response into a structured result."""
+    """Parse introspection HTTP response into a structured result.
+
+    Successful results are cached by a digest of the response body, so loading the
+    same schema again skips the JSON parse and the type walk. Safe to call from a
+    worker thread.
+    """
     if response.status != 200:
         return IntrospectionResult(False, f"HTTP {response.status}", response.text, [])
 
+    key = hashlib.blake2b(response.body, digest_size=16).hexdigest()
+    with _result_cache_lock:
+        cached = _result_cache.get(key)
+        if cached is not None:
+            _result_cache.move_to_end(key)
+            return cached
+
+    result = _build_from_body(response.body)
+    if result.success:
+        with _result_cache_lock:
+            _result_cache[key] = result
+            if len(_result_cache) > RESULT_CACHE_SIZE:
+                _result_cache.popitem(last=False)
+    return result
+
+
+def _build_from_body(body: bytes) -> IntrospectionResult:
     try:
-        data = json.loads(response.text)
+        data = _json.loads(body)
     except Exception as exc:
-        return IntrospectionResult(False, f"Could not parse JSON: {exc}", response.text, [])
+        return IntrospectionResult(False, f"Could not parse JSON: {exc}", _decode(body), [])
 
     errors = data.get("errors")
     if errors:
-        return IntrospectionResult(False, "GraphQL errors", json.dumps(errors, indent=2), [])
+        return IntrospectionResult(False, "GraphQL errors", _json.dumps_indent(errors), [])
 
     types_raw = data.get("data", {}).get("__schema", {}).get("types")
     if not types_raw:
-        return IntrospectionResult(False, "No types returned from schema.", response.text, [])
+        return IntrospectionResult(False, "No types returned from schema.", _decode(body), [])
 
     types = _collect_types(types_raw)
     if not types:
-        return IntrospectionResult(False, "Schema loaded but no object/interface/input types.", response.text, [])
+        return IntrospectionResult(False, "Schema loaded but no object/interface/input types.", _decode(body), [])
 
     type_names = [t.name for t in types]
     summary = f"Schema loaded: {len(types)} types."
@@ -61,66 +126,143 @@ def build_introspection_result(response: GraphQLResponse) -> IntrospectionResult
     return IntrospectionResult(True, summary, details, types)
 
 
-def add_types_to_tree(tree: Any, types: Iterable[TypeInfo]) -> int:
-    """Populate a textual-like Tree with introspection types."""
-    added = 0
+def add_types_to_tree(tree: Any, types: Iterable[TypeInfo], make_label: Callable[[str], Any] = str) -> int:
+    """Populate a textual-like Tree with introspection types.
+
+    Only type nodes are added; their fields are added by ``expand_tree_node`` the first
+    time a node is expanded. Schemas with more than ``BUCKET_THRESHOLD`` types are grouped
+    under alphabetical bucket nodes, which are filled in lazily the same way.
+
+    Textual parses plain ``str`` labels as markup, which costs a parse per node and eats
+    list types such as ``[user]``; pass ``make_label=rich.text.Text`` to skip that.
+    """
     root = getattr(tree, "root", None)
     if root is None:
         return 0
 
-    for type_info in types:
-        type_node = root.add(f"{type_info.name} ({type_info.kind.lower()})", data={"description": type_info.description})
-        for field in type_info.fields:
-            field_data = {"description": field.description, "type": field.type_repr, "args_str": field.args_str}
-            type_node.add(f"{field.name}: {field.type_repr}", data=field_data)
-        added += 1
-    return added
+    types = list(types)
+    if len(types) > BUCKET_THRESHOLD:
+        add = root.add
+        for label, bucket in _bucket_types(types):
+            add(make_label(f"{label} ({len(bucket)})"), data=bucket, allow_expand=True)
+    else:
+        _add_type_nodes(root, types, make_label)
+    return len(types)
+
+
+def expand_tree_node(node: Any, make_label: Callable[[str], Any] = str) -> int:
+    """Add the children of a bucket or type node on its first expansion; return how many were added."""
+    if node.children:
+        return 0
+    data = node.data
+    if isinstance(data, TypeInfo):
+        add = node.add
+        for f in data.fields:
+            add(make_label(f"{f.name}: {f.type_repr}"), data=f, allow_expand=False)
+        return len(data.fields)
+    if isinstance(data, list):
+        _add_type_nodes(node, data, make_label)
+        return len(data)
+    return 0
+
+
+def format_node_details(data: Any) -> str:
+    """Render the markdown details for a node added by ``add_types_to_tree``."""
+    lines = []
+    if isinstance(data, FieldInfo):
+        if data.type_repr:
+            lines.append(f"**Type**: {data.type_repr}")
+        if data.args_str:
+            lines.append(f"**Args**: {data.args_str}")
+    if isinstance(data, (FieldInfo, TypeInfo)) and data.description:
+        lines.append(data.description)
+    return "\n\n".join(lines)
+
+
+def _add_type_nodes(parent: Any, types: list[TypeInfo], make_label: Callable[[str], Any]) -> None:
+    add = parent.add
+    for t in types:
+        add(make_label(f"{t.name} ({t.kind.lower()})"), data=t, allow_expand=bool(t.fields))
+
+
+def _bucket_types(types: list[TypeInfo]) -> list[tuple[str, list[TypeInfo]]]:
+    buckets: dict[str, list[TypeInfo]] = {}
+    for t in types:
+        buckets.setdefault(_BUCKET_BY_LETTER.get(t.name[:1].upper(), "Other"), []).append(t)
+    order = [*_BUCKET_LABELS, "Other"]
+    return [(label, buckets[label]) for label in order if label in buckets]
+
+
+def _decode(body: bytes) -> str:
+    return body.decode("utf-8", errors="replace")
 
 
 def _collect_types(types_raw: Iterable[dict[str, Any]]) -> list[TypeInfo]:
-    types: list[TypeInfo] = []
-    for t in types_raw:
-        name = t.get("name")
-        kind = t.get("kind")
-        if not name or name.startswith("__"):
-            continue
-        if kind not in {"OBJECT", "INTERFACE", "INPUT_OBJECT"}:
-            continue
-        fields_raw = t.get("fields") or []
-        fields = _collect_fields(fields_raw)
-        types.append(TypeInfo(name=name, kind=kind, description=t.get("description") or "", fields=fields))
-    return types
-
-
-def _collect_fields(fields_raw: Iterable[dict[str, Any]]) -> list[FieldInfo]:
-    fields: list[FieldInfo] = []
-    for field in fields_raw:
-        name = field.get("name")
-        if not name:
-            continue
-        type_repr = _type_repr(field.get("type"))
-        description = field.get("description") or ""
-        args_raw = field.get("args") or []
-        args_str = ", ".join(_format_arg(arg) for arg in args_raw if arg.get("name"))
-        fields.append(FieldInfo(name=name, type_repr=type_repr, description=description, args_str=args_str))
-    return fields
-
-
-def _format_arg(arg: dict[str, Any]) -> str:
-    return f"{arg.get('name')}: {_type_repr(arg.get('type'))}"
-
-
-def _type_repr(node: dict[str, Any] | None) -> str:
-    if not node:
-        return "Unknown"
-    name = node.get("name")
-    kind = node.get("kind")
-    of_type = node.get("ofType")
-    if of_type:
-        inner = _type_repr(of_type)
+    intern = sys.intern
+    collect_fields = _collect_fields
+    # Shared by every field and argument of this schema; see _type_repr.
+    type_cache: dict[tuple[str, ...], str] = {}
+    return [
+        TypeInfo(
+            name=name,
+            kind=intern(kind),
+            description=t.get("description") or "",
+            fields=collect_fields(t.get("fields") or (), type_cache),
+        )
+        for t in types_raw
+        if (name := t.get("name")) and not name.startswith("__") and (kind := t.get("kind")) in _TYPE_KINDS
+    ]
+
+
+def _collect_fields(
+    fields_raw: Iterable[dict[str, Any]], type_cache: dict[tuple[str, ...], str] | None = None
+) -> list[FieldInfo]:
+    # Interned: the same few type names and signatures repeat across thousands of fields.
+    intern = sys.intern
+    type_repr = _type_repr
+    format_args = _format_args
+    return [
+        FieldInfo(
+            name=name,
+            type_repr=intern(type_repr(f.get("type"), type_cache)),
+            description=f.get("description") or "",
+            args_str=intern(format_args(f.get("args"), type_cache)),
+        )
+        for f in fields_raw
+        if (name := f.get("name"))
+    ]
+
+
+def _format_args(args_raw: Iterable[dict[str, Any]] | None, type_cache: dict[tuple[str, ...], str] | None = None) -> str:
+    if not args_raw:
+        return ""
+    return ", ".join(
+        f"{name}: {_type_repr(arg.get('type'), type_cache)}" for arg in args_raw if (name := arg.get("name"))
+    )
+
+
+def _type_repr(node: dict[str, Any] | None, cache: dict[tuple[str, ...], str] | None = None) -> str:
+    """Render a type reference such as ``[String!]!``.
+
+    Parsed JSON nodes are distinct dicts even for identical references, so ``cache`` is
+    keyed on the leaf name plus the wrapper kinds rather than on node identity.
+    """
+    wrappers: list[str] = []
+    while node and node.get("ofType"):
+        wrappers.append(node.get("kind"))
+        node = node["ofType"]
+    leaf = (node.get("name") or node.get("kind") or "Unknown") if node else "Unknown"
+    if not wrappers:
+        return leaf
+    key = (leaf, *wrappers)
+    if cache is not None and (hit := cache.get(key)) is not None:
+        return hit
+    text = leaf
+    for kind in reversed(wrappers):
         if kind == "NON_NULL":
-            return f"{inner}!"
-        if kind == "LIST":
-            return f"[{inner}]"
-        return inner
-    return name or kind or "Unknown"
+            text += "!"
+        elif kind == "LIST":
+            text = f"[{text}]"
+    if cache is not None:
+        cache[key] = text
+    return text
@@ -0,0 +1,53 @@
+"""On-disk cache of raw introspection responses, keyed by endpoint and headers."""
+
+import hashlib
+import os
+import time
+from pathlib import Path
+
+APP_DIR_NAME = "http_voyager"
+CACHE_SUBDIR = "introspect"
+ENV_CACHE_DIR = "HTTP_VOYAGER_CACHE_DIR"
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+
+def _cache_dir() -> Path:
+    override = os.environ.get(ENV_CACHE_DIR)
+    if override:
+        return Path(override).expanduser()
+    base = os.environ.get("XDG_CACHE_HOME")
+    if base:
+        return Path(base) / APP_DIR_NAME / CACHE_SUBDIR
+    return Path.home() / ".cache" / APP_DIR_NAME / CACHE_SUBDIR
+
+
+def cache_key(endpoint: str, headers: dict[str, str]) -> str:
+    """Digest of the endpoint and headers; header order and name case don't matter."""
+    digest = hashlib.blake2b(endpoint.encode("utf-8"), digest_size=16)
+    for name, value in sorted((k.lower(), v) for k, v in headers.items()):
+        digest.update(b"\0" + name.encode("utf-8") + b":" + value.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def get(endpoint: str, headers: dict[str, str], ttl: float = DEFAULT_TTL_SECONDS) -> bytes | None:
+    """Return the cached introspection body, or None when missing or older than ``ttl``."""
+    path = _cache_dir() / f"{cache_key(endpoint, headers)}.json"
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def put(endpoint: str, headers: dict[str, str], body: bytes) -> None:
+    """Store a raw introspection body; failures are ignored, the cache is best effort."""
+    directory = _cache_dir()
+    path = directory / f"{cache_key(endpoint, headers)}.json"
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(body)
+        os.replace(tmp, path)
+    except OSError:
+        return
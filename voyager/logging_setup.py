@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import os
 from pathlib import Path
 
 DEFAULT_LOG_FILENAME = "http_voyager.log"
@@ -13,15 +14,10 @@ def _resolve_log_path(log_path: Path | None = None) -> Path:
     return Path(log_path).expanduser().resolve()
 
 
-def _handler_uses_path(handler: logging.Handler, path: Path) -> bool:
-    """Check whether a handler already writes to the given path."""
-    file_name = getattr(handler, "baseFilename", None)
-    if not file_name:
-        return False
-    try:
-        return Path(file_name).resolve() == path
-    except OSError:
-        return False
+def _handler_uses_path(handler: logging.Handler, path: str | os.PathLike[str]) -> bool:
+    """Check whether a handler already writes to the given absolute path."""
+    # FileHandler stores os.path.abspath(filename), so a plain string compare is enough.
+    return getattr(handler, "baseFilename", None) == os.fspath(path)
 
 
 def configure_logging(debug_enabled: bool, log_path: Path | None = None) -> Path | None:
@@ -32,17 +28,18 @@ def configure_logging(debug_enabled: bool, log_path: Path | None = None) -> Path
     path = _resolve_log_path(log_path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    try:
-        handler = logging.FileHandler(path, encoding="utf-8")
-    except OSError:
-        return None
-    handler.setLevel(logging.DEBUG)
-    handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s"))
-
     root = logging.getLogger()
-    root.setLevel(logging.DEBUG)
-    if not any(_handler_uses_path(existing, path) for existing in root.handlers):
+    target = os.path.abspath(path)
+    # Check before opening a FileHandler so repeated calls don't leak file descriptors.
+    if not any(_handler_uses_path(existing, target) for existing in root.handlers):
+        try:
+            handler = logging.FileHandler(path, encoding="utf-8")
+        except OSError:
+            return None
+        handler.setLevel(logging.DEBUG)
+        handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s"))
         root.addHandler(handler)
+    root.setLevel(logging.DEBUG)
 
     logging.getLogger(__name__).debug("Debug logging enabled. Writing to %s", path)
     return path
@@ -1,7 +1,7 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GraphQLTabSpec:
     id: str
     title: str
@@ -12,14 +12,29 @@ class GraphQLTabSpec:
     verify_tls: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GraphQLResponse:
     status: int
-    text: str
+    body: bytes
     duration_ms: float
-
-
-@dataclass
+    # Charset the server declared; the JSON paths read ``body`` directly and ignore it.
+    encoding: str | None = None
+    _text: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def text(self) -> str:
+        """Response body decoded with its declared charset for display; decoded once, then cached."""
+        if self._text is None:
+            try:
+                text = self.body.decode(self.encoding or "utf-8", errors="replace")
+            except LookupError:
+                text = self.body.decode("utf-8", errors="replace")
+            # cached_property needs a __dict__, which slots=True removes.
+            object.__setattr__(self, "_text", text)
+        return self._text  # type: ignore[return-value]
+
+
+@dataclass(slots=True, frozen=True)
 class HttpTabSpec:
     id: str
     title: str
@@ -30,7 +45,7 @@ class HttpTabSpec:
     verify_tls: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WebSocketTabSpec:
     id: str
     title: str
@@ -1,5 +1,6 @@
-import json
+from collections.abc import Callable
 
+from . import _json
 from .models import GraphQLResponse
 
 
@@ -7,7 +8,7 @@ def parse_json_object(raw: str) -> dict:
     raw = raw.strip()
     if not raw:
         return {}
-    parsed = json.loads(raw)
+    parsed = _json.loads_exact(raw)
     if not isinstance(parsed, dict):
         raise ValueError("Expected a JSON object.")
     return parsed
@@ -17,31 +18,59 @@ def parse_headers(raw: str) -> dict[str, str]:
     raw = raw.strip()
     if not raw:
         return {}
+    if raw[0] not in "{[":
+        # Key: Value lines can't be JSON containers; skip building a decode error.
+        return parse_header_lines(raw)
     try:
-        parsed = json.loads(raw)
+        parsed = _json.loads_exact(raw)
         if not isinstance(parsed, dict):
             raise ValueError("Headers JSON must be an object.")
         return {str(k): str(v) for k, v in parsed.items()}
-    except json.JSONDecodeError:
+    except _json.JSONDecodeError:
         return parse_header_lines(raw)
 
 
 def parse_header_lines(raw: str) -> dict[str, str]:
     headers: dict[str, str] = {}
     for line in raw.splitlines():
-        if not line.strip():
+        # One partition per line; only the two halves are stripped.
+        key, sep, value = line.partition(":")
+        key = key.strip()
+        if not key:
+            if value.strip():
+                raise ValueError(f"Invalid header line: {line!r}")
             continue
-        if ":" not in line:
+        if not sep:
             raise ValueError(f"Invalid header line: {line!r}")
-        key, value = line.split(":", 1)
-        headers[key.strip()] = value.strip()
+        headers[key] = value.strip()
     return headers
 
 
+class LastInputCache:
+    """Wrap a text parser so re-parsing the same text as last time is skipped.
+
+    Each call returns a shallow copy, so callers may add keys (e.g. a default
+    Content-Type) without touching the cached result. Errors are not cached.
+    """
+
+    __slots__ = ("_parse", "_raw", "_parsed")
+
+    def __init__(self, parse: Callable[[str], dict]) -> None:
+        self._parse = parse
+        self._raw: str | None = None
+        self._parsed: dict = {}
+
+    def __call__(self, raw: str) -> dict:
+        if raw != self._raw:
+            self._parsed = self._parse(raw)
+            self._raw = raw
+        return dict(self._parsed)
+
+
 def format_response(response: GraphQLResponse) -> str:
     try:
-        parsed = json.loads(response.text)
-        body = json.dumps(parsed, indent=2)
+        parsed = _json.loads(response.body)
+        body = _json.dumps_indent(parsed)
     except Exception:
         body = response.text
     return f"Status: {response.status}\nTime: {response.duration_ms:.1f} ms\nBody:\n{body}"
@@ -0,0 +1,124 @@
+"""Schema explorer shared by the Query and Docs tabs."""
+
+import asyncio
+
+from rich.text import Text
+from textual.widgets import Tree
+
+from . import introspection_cache
+from .http_client import perform_request
+from .introspection import (
+    INTROSPECTION_BODY,
+    IntrospectionResult,
+    add_types_to_tree,
+    build_introspection_result,
+    expand_tree_node,
+    format_node_details,
+)
+from .models import GraphQLResponse
+from .ui_components import VoyagerTabPane
+
+
+class SchemaTreeTabPane(VoyagerTabPane):
+    """Tab with a schema ``tree`` and a ``details`` pane filled from GraphQL introspection.
+
+    Subclasses provide the ``endpoint``, ``headers``, ``verify``, ``status``, ``tree`` and
+    ``details`` widgets, a ``busy`` reactive and a ``_parse_headers`` cache.
+    """
+
+    async def load_docs(self, refresh: bool = False) -> None:
+        """Load the schema, reusing the on-disk copy unless ``refresh`` is set."""
+        if self.busy:  # type: ignore[attr-defined]
+            return
+
+        endpoint, raw_headers, verify_tls = self._docs_target()
+        if not endpoint:
+            self._set_status("Please provide an endpoint.")
+            return
+
+        try:
+            headers = self._parse_headers(raw_headers)  # type: ignore[attr-defined]
+        except ValueError as exc:
+            self._set_status(str(exc))
+            return
+
+        headers.setdefault("Content-Type", "application/json")
+
+        if not refresh and await self._load_cached_schema(endpoint, headers):
+            return
+
+        self.busy = True
+        self._textarea("details").load_text(f"Loading schema from {endpoint} ...")
+        self._set_status(f"Loading schema from {endpoint} ...")
+        try:
+            response = await perform_request(endpoint, INTROSPECTION_BODY, headers, verify_tls=verify_tls)
+        except Exception as exc:
+            self._set_status(f"Failed: {exc}")
+        else:
+            if await self._populate_tree(response):
+                introspection_cache.put(endpoint, headers, response.body)
+        finally:
+            self.busy = False
+
+    def _docs_target(self) -> tuple[str, str, bool]:
+        """Endpoint, raw headers and TLS setting to introspect."""
+        return (
+            self._input("endpoint").value.strip(),
+            self._textarea("headers").text,
+            self._checkbox("verify").value,
+        )
+
+    async def _load_cached_schema(self, endpoint: str, headers: dict[str, str]) -> bool:
+        cached = introspection_cache.get(endpoint, headers)
+        if cached is None:
+            return False
+        return await self._populate_tree(GraphQLResponse(status=200, body=cached, duration_ms=0.0))
+
+    async def _populate_tree(self, response: GraphQLResponse) -> bool:
+        # Parsing a large schema takes long enough to freeze the UI, so it runs on a worker thread.
+        result = await asyncio.to_thread(build_introspection_result, response)
+        return self._populate_tree_from_result(result)
+
+    def _populate_tree_from_result(self, result: IntrospectionResult) -> bool:
+        tree = self._tree()
+        self._clear_tree()
+        if not result.success:
+            self._show_tree_message(tree, result.status, result.details)
+            return False
+
+        # One repaint for the whole schema instead of one per added node; fields are
+        # added when a type is first expanded.
+        with self.app.batch_update():
+            add_types_to_tree(tree, result.types, make_label=Text)
+            tree.root.expand()
+        tree.refresh(layout=True)
+        self._set_status(result.status)
+        self._textarea("details").load_text(result.details)
+        # Focus on first type to show info immediately.
+        first_child = tree.root.children[0] if tree.root.children else None
+        if first_child:
+            tree.move_cursor(first_child)
+            tree.scroll_to_node(first_child)
+        return True
+
+    def _show_tree_message(self, tree: Tree, status: str, details: str) -> None:
+        self._set_status(status)
+        self._textarea("details").load_text(details)
+        tree.refresh(layout=True)
+
+    def _clear_tree(self) -> None:
+        tree = self._tree()
+        # Drop all nodes in one pass; removing children one by one invalidates the tree per node.
+        tree.root.remove_children()
+        tree.refresh(layout=True)
+
+    def _tree(self) -> Tree:
+        return self._get_widget("tree", Tree)
+
+    async def on_tree_node_selected(self, event: Tree.NodeSelected) -> None:
+        node = event.node
+        details = format_node_details(node.data) or node.label.plain
+        self._textarea("details").load_text(details)
+
+    async def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        expand_tree_node(event.node, make_label=Text)
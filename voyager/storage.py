@@ -1,65 +1,197 @@
-import json
+import asyncio
+import functools
 import os
-from dataclasses import asdict, is_dataclass
+import threading
+from collections.abc import Callable
+from dataclasses import asdict, fields, is_dataclass, replace
 from pathlib import Path
 from typing import Any
 
+from . import _json
 from .models import GraphQLTabSpec, HttpTabSpec, WebSocketTabSpec
 
 APP_DIR_NAME = "http_voyager"
 CONFIG_FILE_NAME = "state.json"
 ENV_CONFIG_DIR = "HTTP_VOYAGER_CONFIG_DIR"
+ENV_PRETTY_STATE = "HTTP_VOYAGER_PRETTY"
+SAVE_DELAY_SECONDS = 0.25
 
-
-def _config_dir() -> Path:
-    override = os.environ.get(ENV_CONFIG_DIR)
-    if override:
-        return Path(override).expanduser()
-    base = os.environ.get("XDG_CONFIG_HOME")
-    if base:
-        return Path(base) / APP_DIR_NAME
-    return Path.home() / ".config" / APP_DIR_NAME
+# Sections share one file, so concurrent read-modify-write cycles must not interleave.
+_save_lock = threading.Lock()
 
 
 def _config_path() -> Path:
-    return _config_dir() / CONFIG_FILE_NAME
+    # The app may set ENV_CONFIG_DIR at startup, so the cache is keyed on the variables themselves.
+    environ = os.environ
+    return _resolve_config_path(environ.get(ENV_CONFIG_DIR), environ.get("XDG_CONFIG_HOME"))
+
+
+@functools.lru_cache(maxsize=4)
+def _resolve_config_path(override: str | None, xdg_config_home: str | None) -> Path:
+    if override:
+        return Path(override).expanduser() / CONFIG_FILE_NAME
+    if xdg_config_home:
+        return Path(xdg_config_home) / APP_DIR_NAME / CONFIG_FILE_NAME
+    return Path.home() / ".config" / APP_DIR_NAME / CONFIG_FILE_NAME
 
 
 def load_last_state[T: (GraphQLTabSpec, HttpTabSpec, WebSocketTabSpec)](
     default_spec: T, section: str | None = None
 ) -> T:
     """Load last saved state for a section, merging onto defaults."""
+    _, data = _read_state(_config_path())
+    return _merge_onto(default_spec, data, section)
+
+
+def save_state(spec: Any, section: str | None = None) -> None:
+    """Persist last used settings to config file. Safe to call from worker threads."""
     path = _config_path()
-    if not path.exists():
-        return default_spec
+    with _save_lock:
+        current, data = _read_state(path)
+        _write_if_changed(path, _with_section(data, spec, section), current)
+
+
+class StateStore:
+    """In-memory copy of the state file for one app run.
+
+    The file is read once, when the store is created; ``load`` is answered from memory
+    and ``save`` updates memory and writes through, without re-reading the file.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self._path = path or _config_path()
+        self._blob, self._data = _read_state(self._path)
+
+    def load[T: (GraphQLTabSpec, HttpTabSpec, WebSocketTabSpec)](self, default_spec: T, section: str | None = None) -> T:
+        return _merge_onto(default_spec, self._data, section)
+
+    def save(self, spec: Any, section: str | None = None) -> None:
+        """Record ``spec`` and write the file if its content changed. Safe to call from worker threads."""
+        with _save_lock:
+            data = _with_section(self._data, spec, section)
+            self._blob = _write_if_changed(self._path, data, self._blob)
+            self._data = data
+
+
+def _read_state(path: Path) -> tuple[bytes | None, Any]:
+    """Return the raw file bytes and the parsed document; either is None when unavailable."""
+    try:
+        blob = path.read_bytes()
+    except OSError:
+        return None, None
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        return blob, _json.loads(blob)
     except Exception:
-        return default_spec
+        return blob, None
+
+
+def _merge_onto[T: (GraphQLTabSpec, HttpTabSpec, WebSocketTabSpec)](
+    default_spec: T, data: Any, section: str | None
+) -> T:
     payload = _select_section(data, section)
-    merged = _spec_to_dict(default_spec)
-    merged.update({k: v for k, v in payload.items() if k in merged})
-    return type(default_spec)(**merged)  # type: ignore[arg-type]
+    if not payload:
+        return default_spec
+    known = {f.name for f in fields(default_spec)}
+    return replace(default_spec, **{k: v for k, v in payload.items() if k in known})
 
 
-def save_state(spec: Any, section: str | None = None) -> None:
-    """Persist last used settings to config file."""
-    path = _config_path()
-    path.parent.mkdir(parents=True, exist_ok=True)
+def _with_section(data: Any, spec: Any, section: str | None) -> dict[str, Any]:
+    # Returns a new document; the one passed in may be shared with a StateStore.
     payload = _spec_to_dict(spec)
-    existing: dict[str, Any] = {}
-    if section:
-        if path.exists():
+    if not section:
+        return payload
+    existing = data if isinstance(data, dict) else {}
+    return {**existing, section: payload}
+
+
+def _write_if_changed(path: Path, data: dict[str, Any], current: bytes | None) -> bytes:
+    # Compact unless asked otherwise; the file is only ever read back by this module.
+    blob = _json.dumps(data, indent=bool(os.environ.get(ENV_PRETTY_STATE)))
+    if blob == current:
+        return blob  # Repeated sends with unchanged inputs skip the write entirely.
+    if current is None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    _write_atomic(path, blob)
+    return blob
+
+
+class StateSaver:
+    """Coalesce state saves and write them on a worker thread.
+
+    ``schedule`` only records the newest spec; one task waits ``delay`` seconds and saves
+    whatever is newest then, so a burst of sends costs a single write off the event loop.
+    """
+
+    def __init__(
+        self,
+        save: Callable[[Any], None],
+        on_error: Callable[[Exception], None] | None = None,
+        delay: float = SAVE_DELAY_SECONDS,
+    ) -> None:
+        self._save = save
+        self._on_error = on_error
+        self._delay = delay
+        self._pending: Any = None
+        self._task: asyncio.Task[None] | None = None
+        # Every spec taken for saving gets a generation; a write never replaces a newer one.
+        self._generation = 0
+        self._written = 0
+        self._write_lock = threading.Lock()
+
+    def schedule(self, spec: Any) -> None:
+        self._pending = spec
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def flush(self) -> None:
+        """Save a pending spec right away, e.g. when the tab is unmounted.
+
+        Cancelling the task cannot stop a write already running on a worker thread; if one
+        is, this waits for it and then writes the newer spec over it.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._pending is None:
+            return
+        generation, spec = self._take()
+        try:
+            self._save_in_order(generation, spec)
+        except Exception as exc:
+            self._report(exc)
+
+    async def _run(self) -> None:
+        # Specs scheduled while a write is in flight are picked up by the next iteration.
+        while self._pending is not None:
+            await asyncio.sleep(self._delay)
+            generation, spec = self._take()
             try:
-                existing_data = json.loads(path.read_text(encoding="utf-8"))
-                if isinstance(existing_data, dict):
-                    existing = existing_data
-            except Exception:
-                existing = {}
-        existing[section] = payload
-        path.write_text(json.dumps(existing, indent=2), encoding="utf-8")
-    else:
-        path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+                await asyncio.to_thread(self._save_in_order, generation, spec)
+            except Exception as exc:
+                self._report(exc)
+
+    def _take(self) -> tuple[int, Any]:
+        self._generation += 1
+        spec, self._pending = self._pending, None
+        return self._generation, spec
+
+    def _save_in_order(self, generation: int, spec: Any) -> None:
+        with self._write_lock:
+            if generation < self._written:
+                return  # flush already saved a newer spec
+            self._save(spec)
+            self._written = generation
+
+    def _report(self, exc: Exception) -> None:
+        if self._on_error is not None:
+            self._on_error(exc)
+
+
+def _write_atomic(path: Path, blob: bytes) -> None:
+    """Write to a sibling temp file and swap it in, so a crash never leaves a truncated file."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(blob)
+    os.replace(tmp, path)
 
 
 def _select_section(data: Any, section: str | None) -> dict[str, Any]:
@@ -1,41 +1,24 @@
 import asyncio
+import functools
 import logging
 import shutil
 import subprocess
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from textual.containers import Container, Horizontal, Vertical
 from textual.reactive import reactive
-from textual.widgets import Checkbox, Input, Select, Static, TabPane, TextArea, Tree
+from textual.widgets import Checkbox, Input, Select, Static, TextArea, Tree
 
+from . import _json
 from .http_client import perform_http_request, perform_request
-from .introspection import add_types_to_tree, build_introspection_result
 from .models import GraphQLTabSpec, HttpTabSpec
-from .parsing import format_response, parse_headers, parse_json_object
-from .ui_components import SmallButton
-
-INTROSPECTION_QUERY = """
-query IntrospectionQuery {
-  __schema {
-    types {
-      kind
-      name
-      description
-      fields(includeDeprecated: true) {
-        name
-        description
-        args {
-          name
-          description
-          type { kind name ofType { kind name ofType { kind name } } }
-        }
-        type { kind name ofType { kind name ofType { kind name } } }
-      }
-    }
-  }
-}
-"""
+from .parsing import LastInputCache, format_response, parse_headers, parse_json_object
+from .schema_tree import SchemaTreeTabPane
+from .ui_components import SmallButton, VoyagerTabPane
+
+# Resolved once; the clipboard fallback used to search PATH on every copy.
+_PBCOPY = shutil.which("pbcopy")
 
 
 async def _copy_text_with_fallback(
@@ -47,7 +30,7 @@ async def _copy_text_with_fallback(
     clipboard_copier: Callable[[str], Awaitable[None]] | None = None,
     pbcopy_path: str | None = None,
 ) -> None:
-    if not text.strip():
+    if not text or text.isspace():  # unlike strip(), never copies the text
         set_status("Nothing to copy.")
         return
     try:
@@ -61,12 +44,22 @@ async def _copy_text_with_fallback(
         set_status("Response copied to clipboard.")
         return
 
-    pbcopy_exec = pbcopy_path or shutil.which("pbcopy")
+    pbcopy_exec = pbcopy_path or _PBCOPY
     if not pbcopy_exec:
+        # Last resort; pyobjc is slow to import, so it is only loaded when it is needed.
+        if _pasteboard_api() is not None:
+            try:
+                await asyncio.to_thread(_copy_to_pasteboard, text)
+            except Exception as exc:  # pragma: no cover - runtime-only clipboard failure
+                logger.debug("NSPasteboard copy failed: %s", exc)
+            else:
+                set_status("Response copied to clipboard.")
+                return
         set_status("Copy failed: no clipboard available.")
         return
     try:
-        subprocess.run(  # noqa: S603 - uses local clipboard binary with trusted input
+        await asyncio.to_thread(
+            subprocess.run,  # noqa: S603 - uses local clipboard binary with trusted input
             [pbcopy_exec],
             input=text,
             text=True,
@@ -81,18 +74,68 @@ async def _copy_text_with_fallback(
     set_status("Response copied via pbcopy.")
 
 
-class GraphQLTab(TabPane):
+def _is_blank(textarea: TextArea) -> bool:
+    """Cheap emptiness check that avoids materializing ``textarea.text``."""
+    document = textarea.document
+    return document.line_count == 1 and not document.get_line(0).strip()
+
+
+@functools.cache
+def _pasteboard_api() -> tuple[Any, Any] | None:
+    try:
+        from AppKit import NSPasteboard, NSPasteboardTypeString  # type: ignore
+    except Exception:  # pragma: no cover - pyobjc is optional and macOS-only
+        return None
+    return NSPasteboard, NSPasteboardTypeString
+
+
+def _copy_to_pasteboard(text: str) -> None:
+    pasteboard_cls, string_type = _pasteboard_api()
+    pasteboard = pasteboard_cls.generalPasteboard()
+    pasteboard.clearContents()
+    if not pasteboard.setString_forType_(text, string_type):
+        raise RuntimeError("NSPasteboard rejected the text.")
+
+
+class GraphQLTab(SchemaTreeTabPane):
     """Single GraphQL playground view."""
 
+    _WIDGET_NAMES = (
+        "endpoint",
+        "headers",
+        "verify",
+        "variables",
+        "query",
+        "send",
+        "load-docs",
+        "refresh-docs",
+        "clear",
+        "copy-response",
+        "status",
+        "response",
+        "tree",
+        "details",
+    )
+
+    _STATE_SECTION = "graphql"
+
     busy: reactive[bool] = reactive(False)
     logger = logging.getLogger(__name__)
 
     def __init__(self, spec: GraphQLTabSpec) -> None:
         super().__init__(title="Query", id="query")
         self.spec = spec
-
-    def _wid(self, name: str) -> str:
-        return f"{self.id}-{name}"
+        self._parse_headers = LastInputCache(parse_headers)
+        self._parse_variables = LastInputCache(parse_json_object)
+
+    def _button_handlers(self) -> dict[str, Callable[[], object]]:
+        return {
+            "send": lambda: asyncio.create_task(self.send()),
+            "load-docs": lambda: asyncio.create_task(self.load_docs()),
+            "refresh-docs": lambda: asyncio.create_task(self.load_docs(refresh=True)),
+            "clear": self.clear_response,
+            "copy-response": lambda: asyncio.create_task(self.copy_response()),
+        }
 
     def compose(self):
         with Container(classes="layout"):
@@ -102,58 +145,59 @@ class GraphQLTab(TabPane):
                     yield Input(
                         value=self.spec.endpoint,
                         placeholder="GraphQL endpoint",
-                        id=self._wid("endpoint"),
+                        id=self._wids["endpoint"],
                         classes="endpoint-input",
                     )
                     yield Static("Headers (JSON object or Key: Value per line)", classes="label")
                     yield TextArea(
                         self.spec.headers,
                         language="json",
-                        id=self._wid("headers"),
+                        id=self._wids["headers"],
                         classes="box headers-box",
                     )
                     yield Checkbox(
                         "Verify TLS certificates (recommended)",
                         value=self.spec.verify_tls,
-                        id=self._wid("verify"),
+                        id=self._wids["verify"],
                     )
                     yield Static("Variables (JSON)", classes="label")
                     yield TextArea(
                         self.spec.variables,
                         language="json",
-                        id=self._wid("variables"),
+                        id=self._wids["variables"],
                         classes="box vars-box",
                     )
                     yield Static("Query", classes="label")
                     yield TextArea(
                         self.spec.query,
                         language="graphql",
-                        id=self._wid("query"),
+                        id=self._wids["query"],
                         show_line_numbers=True,
                         classes="box query-box",
                     )
                     with Horizontal(classes="actions"):
-                        yield SmallButton("Send (Ctrl+S / F5)", id=self._wid("send"), variant="primary")
-                        yield SmallButton("Load Docs", id=self._wid("load-docs"), variant="ghost")
-                        yield SmallButton("Clear", id=self._wid("clear"), variant="ghost")
-                        yield SmallButton("Copy", id=self._wid("copy-response"), variant="ghost")
-                    yield Static("", id=self._wid("status"), classes="status")
+                        yield SmallButton("Send (Ctrl+S / F5)", id=self._wids["send"], variant="primary")
+                        yield SmallButton("Load Docs", id=self._wids["load-docs"], variant="ghost")
+                        yield SmallButton("Refresh Docs", id=self._wids["refresh-docs"], variant="ghost")
+                        yield SmallButton("Clear", id=self._wids["clear"], variant="ghost")
+                        yield SmallButton("Copy", id=self._wids["copy-response"], variant="ghost")
+                    yield Static("", id=self._wids["status"], classes="status")
                 with Vertical(classes="right-panel"):
                     yield TextArea(
                         "",
                         language="json",
-                        id=self._wid("response"),
+                        id=self._wids["response"],
                         read_only=True,
                         classes="box response-box response-section",
                     )
                     with Container(classes="docs-section"):
                         yield Static("Explorer", classes="label")
-                        yield Tree("Schema", id=self._wid("tree"), classes="box docs-tree")
+                        yield Tree("Schema", id=self._wids["tree"], classes="box docs-tree")
                         yield Static("Details", classes="label")
                         yield TextArea(
                             "",
                             language="markdown",
-                            id=self._wid("details"),
+                            id=self._wids["details"],
                             read_only=True,
                             classes="box response-box",
                         )
@@ -176,11 +220,13 @@ class GraphQLTab(TabPane):
         if self.busy:
             return
 
-        endpoint = self._input("endpoint").value.strip()
-        query = self._textarea("query").text.strip()
-        raw_variables = self._textarea("variables").text
-        raw_headers = self._textarea("headers").text
-        verify_tls = self._checkbox("verify").value
+        # Read the widgets once; the same spec is reused for persisting state.
+        spec = self.current_spec()
+        endpoint = spec.endpoint
+        query = spec.query.strip()
+        raw_variables = spec.variables
+        raw_headers = spec.headers
+        verify_tls = spec.verify_tls
 
         if not endpoint:
             self._set_response("Please provide an endpoint URL.")
@@ -190,22 +236,24 @@ class GraphQLTab(TabPane):
             return
 
         try:
-            variables = parse_json_object(raw_variables) if raw_variables.strip() else {}
+            variables = self._parse_variables(raw_variables) if raw_variables.strip() else {}
         except ValueError as exc:
             self._set_response(f"Variables are not valid JSON:\n{exc}")
             return
 
         try:
-            headers = parse_headers(raw_headers)
+            headers = self._parse_headers(raw_headers)
         except ValueError as exc:
             self._set_response(str(exc))
             return
 
         headers.setdefault("Content-Type", "application/json")
-        payload = {"query": query, "variables": variables}
+        # Encoded here (orjson when available) so the transport sends the bytes as-is.
+        payload = _json.dumps({"query": query, "variables": variables})
 
+        # watch_busy shows "Sending request..." in the status line; the response box is
+        # only reloaded once, with the result.
         self.busy = True
-        self._set_response("Sending request...")
         try:
             response = await perform_request(endpoint, payload, headers, verify_tls)
         except Exception as exc:  # pragma: no cover - network errors are runtime-only
@@ -217,39 +265,19 @@ class GraphQLTab(TabPane):
                 self._set_status("Warning: TLS verification disabled for this request.")
         finally:
             self.busy = False
-            self._persist_state()
+            self._persist_state(spec)
 
     async def copy_response(self) -> None:
-        await _copy_text_with_fallback(self.app, self._textarea("response").text, self.logger, self._set_status)
-
-    def on_button_pressed(self, event: SmallButton.Pressed) -> None:
-        if event.button.id == self._wid("send"):
-            asyncio.create_task(self.send())
-        elif event.button.id == self._wid("load-docs"):
-            asyncio.create_task(self.load_docs())
-        elif event.button.id == self._wid("clear"):
-            self.clear_response()
-        elif event.button.id == self._wid("copy-response"):
-            asyncio.create_task(self.copy_response())
-
-    def _textarea(self, name: str) -> TextArea:
-        return self.query_one(f"#{self._wid(name)}", TextArea)
-
-    def _input(self, name: str) -> Input:
-        return self.query_one(f"#{self._wid(name)}", Input)
-
-    def _checkbox(self, name: str) -> Checkbox:
-        return self.query_one(f"#{self._wid(name)}", Checkbox)
-
-    def _button(self, name: str) -> SmallButton:
-        return self.query_one(f"#{self._wid(name)}", SmallButton)
+        textarea = self._textarea("response")
+        if _is_blank(textarea):
+            self._set_status("Nothing to copy.")
+            return
+        # .text joins every line of the document, so it is read only once we know there is content.
+        await _copy_text_with_fallback(self.app, textarea.text, self.logger, self._set_status)
 
     def _set_response(self, message: str) -> None:
         self._textarea("response").load_text(message)
 
-    def _set_status(self, message: str) -> None:
-        self.query_one(f"#{self._wid('status')}", Static).update(message)
-
     def set_status(self, message: str) -> None:
         self._set_status(message)
 
@@ -264,109 +292,25 @@ class GraphQLTab(TabPane):
             verify_tls=self._checkbox("verify").value,
         )
 
-    def _persist_state(self) -> None:
-        spec = GraphQLTabSpec(
-            id=self.spec.id,
-            title=self.spec.title,
-            endpoint=self._input("endpoint").value.strip(),
-            query=self._textarea("query").text,
-            variables=self._textarea("variables").text,
-            headers=self._textarea("headers").text,
-            verify_tls=self._checkbox("verify").value,
-        )
-        try:
-            self.app.save_state(spec, "graphql")  # type: ignore[attr-defined]
-        except Exception:
-            self._set_status("Could not save state.")
-
-    def _tree(self) -> Tree:
-        return self.query_one(f"#{self._wid('tree')}", Tree)
-
-    async def load_docs(self) -> None:
-        if self.busy:
-            return
 
-        endpoint = self._input("endpoint").value.strip()
-        raw_headers = self._textarea("headers").text
-        verify_tls = self._checkbox("verify").value
-
-        if not endpoint:
-            self._set_status("Please provide an endpoint.")
-            return
-
-        try:
-            headers = parse_headers(raw_headers)
-        except ValueError as exc:
-            self._set_status(str(exc))
-            return
-
-        headers.setdefault("Content-Type", "application/json")
-        payload = {"query": INTROSPECTION_QUERY, "variables": {}}
-
-        self.busy = True
-        self._textarea("details").load_text(f"Loading schema from {endpoint} ...")
-        self._set_status(f"Loading schema from {endpoint} ...")
-        try:
-            response = await perform_request(endpoint, payload, headers, verify_tls=verify_tls)
-        except Exception as exc:
-            self._set_status(f"Failed: {exc}")
-        else:
-            self._populate_tree(response)
-        finally:
-            self.busy = False
-
-    def _populate_tree(self, response) -> None:
-        tree = self._tree()
-        self._clear_tree()
-        result = build_introspection_result(response)
-        if not result.success:
-            self._show_tree_message(tree, result.status, result.details)
-            return
-
-        add_types_to_tree(tree, result.types)
-        tree.root.expand_all()
-        tree.refresh(layout=True)
-        self._set_status(result.status)
-        self._textarea("details").load_text(result.details)
-        # Focus on first type to show info immediately.
-        first_child = tree.root.children[0] if tree.root.children else None
-        if first_child:
-            tree.focus_node(first_child)
-            tree.scroll_to_node(first_child)
-
-    def _show_tree_message(self, tree: Tree, status: str, details: str) -> None:
-        self._set_status(status)
-        self._textarea("details").load_text(details)
-        tree.refresh(layout=True)
-
-    def _clear_tree(self) -> None:
-        tree = self._tree()
-        root = tree.root
-        # Remove children explicitly; TreeNode has no clear().
-        for child in list(root.children):
-            child.remove()
-        tree.refresh(layout=True)
-
-    async def on_tree_node_selected(self, event: Tree.NodeSelected) -> None:  # type: ignore[override]
-        node = event.node
-        data = node.data if isinstance(node.data, dict) else {}
-        desc = data.get("description") or ""
-        type_repr = data.get("type") or ""
-        args_str = data.get("args_str") or ""
-        lines = []
-        if type_repr:
-            lines.append(f"**Type**: {type_repr}")
-        if args_str:
-            lines.append(f"**Args**: {args_str}")
-        if desc:
-            lines.append(desc)
-        details = "\n\n".join(lines) or node.label.plain
-        self._textarea("details").load_text(details)
-
-
-class HttpTab(TabPane):
+class HttpTab(VoyagerTabPane):
     """Generic HTTP request tab."""
 
+    _WIDGET_NAMES = (
+        "method",
+        "endpoint",
+        "verify",
+        "headers",
+        "body",
+        "send",
+        "clear",
+        "copy-response",
+        "status",
+        "response",
+    )
+
+    _STATE_SECTION = "http"
+
     busy: reactive[bool] = reactive(False)
     logger = logging.getLogger(__name__)
 
@@ -383,9 +327,14 @@ class HttpTab(TabPane):
     def __init__(self, spec: HttpTabSpec) -> None:
         super().__init__(title="HTTP", id="http")
         self.spec = spec
+        self._parse_headers = LastInputCache(parse_headers)
 
-    def _wid(self, name: str) -> str:
-        return f"{self.id}-{name}"
+    def _button_handlers(self) -> dict[str, Callable[[], object]]:
+        return {
+            "send": lambda: asyncio.create_task(self.send()),
+            "clear": self.clear_response,
+            "copy-response": lambda: asyncio.create_task(self.copy_response()),
+        }
 
     def compose(self):
         with Container(classes="layout"):
@@ -398,45 +347,45 @@ class HttpTab(TabPane):
                             yield Select(
                                 self.METHODS,
                                 value=self.spec.method,
-                                id=self._wid("method"),
+                                id=self._wids["method"],
                                 classes="method-select",
                             )
                             with Container(classes="expand"):
                                 yield Input(
                                     value=self.spec.url,
                                     placeholder="https://api.example.com/resource",
-                                    id=self._wid("endpoint"),
+                                    id=self._wids["endpoint"],
                                     classes="endpoint-input",
                                 )
                     yield Checkbox(
                         "Verify TLS certificates (recommended)",
                         value=self.spec.verify_tls,
-                        id=self._wid("verify"),
+                        id=self._wids["verify"],
                     )
                     yield Static("Headers (JSON object or Key: Value per line)", classes="label")
                     yield TextArea(
                         self.spec.headers,
                         language="json",
-                        id=self._wid("headers"),
+                        id=self._wids["headers"],
                         classes="box headers-box",
                     )
                     yield Static("Body (optional)", classes="label")
                     yield TextArea(
                         self.spec.body,
                         language="json",
-                        id=self._wid("body"),
+                        id=self._wids["body"],
                         classes="box body-box",
                     )
                     with Horizontal(classes="actions"):
-                        yield SmallButton("Send (Ctrl+S / F5)", id=self._wid("send"), variant="primary")
-                        yield SmallButton("Clear", id=self._wid("clear"), variant="ghost")
-                        yield SmallButton("Copy", id=self._wid("copy-response"), variant="ghost")
-                    yield Static("", id=self._wid("status"), classes="status")
+                        yield SmallButton("Send (Ctrl+S / F5)", id=self._wids["send"], variant="primary")
+                        yield SmallButton("Clear", id=self._wids["clear"], variant="ghost")
+                        yield SmallButton("Copy", id=self._wids["copy-response"], variant="ghost")
+                    yield Static("", id=self._wids["status"], classes="status")
                 with Vertical(classes="right-panel"):
                     yield TextArea(
                         "",
                         language="json",
-                        id=self._wid("response"),
+                        id=self._wids["response"],
                         read_only=True,
                         classes="box response-box response-section",
                     )
@@ -456,32 +405,40 @@ class HttpTab(TabPane):
         self._textarea("response").load_text("")
 
     async def copy_response(self) -> None:
-        await _copy_text_with_fallback(self.app, self._textarea("response").text, self.logger, self._set_status)
+        textarea = self._textarea("response")
+        if _is_blank(textarea):
+            self._set_status("Nothing to copy.")
+            return
+        # .text joins every line of the document, so it is read only once we know there is content.
+        await _copy_text_with_fallback(self.app, textarea.text, self.logger, self._set_status)
 
     async def send(self) -> None:
         if self.busy:
             return
 
-        endpoint = self._input("endpoint").value.strip()
-        method = (self._select("method").value or "GET").upper()
-        raw_headers = self._textarea("headers").text
-        body_text = self._textarea("body").text
-        verify_tls = self._checkbox("verify").value
+        # Read the widgets once; the same spec is reused for persisting state.
+        spec = self.current_spec()
+        endpoint = spec.url
+        method = spec.method
+        raw_headers = spec.headers
+        body_text = spec.body
+        verify_tls = spec.verify_tls
 
         if not endpoint:
             self._set_response("Please provide a URL.")
             return
 
         try:
-            headers = parse_headers(raw_headers)
+            headers = self._parse_headers(raw_headers)
         except ValueError as exc:
             self._set_response(str(exc))
             return
 
         body = body_text if body_text.strip() else None
 
+        # watch_busy shows "Sending request..." in the status line; the response box is
+        # only reloaded once, with the result.
         self.busy = True
-        self._set_response("Sending request...")
         try:
             response = await perform_http_request(endpoint, method, headers, body, verify_tls)
         except Exception as exc:  # pragma: no cover - network errors are runtime-only
@@ -493,37 +450,14 @@ class HttpTab(TabPane):
                 self._set_status("Warning: TLS verification disabled for this request.")
         finally:
             self.busy = False
-            self._persist_state()
-
-    def on_button_pressed(self, event: SmallButton.Pressed) -> None:
-        if event.button.id == self._wid("send"):
-            asyncio.create_task(self.send())
-        elif event.button.id == self._wid("clear"):
-            self.clear_response()
-        elif event.button.id == self._wid("copy-response"):
-            asyncio.create_task(self.copy_response())
-
-    def _textarea(self, name: str) -> TextArea:
-        return self.query_one(f"#{self._wid(name)}", TextArea)
-
-    def _input(self, name: str) -> Input:
-        return self.query_one(f"#{self._wid(name)}", Input)
-
-    def _checkbox(self, name: str) -> Checkbox:
-        return self.query_one(f"#{self._wid(name)}", Checkbox)
+            self._persist_state(spec)
 
     def _select(self, name: str) -> Select:
-        return self.query_one(f"#{self._wid(name)}", Select)
-
-    def _button(self, name: str) -> SmallButton:
-        return self.query_one(f"#{self._wid(name)}", SmallButton)
+        return self._get_widget(name, Select)
 
     def _set_response(self, message: str) -> None:
         self._textarea("response").load_text(message)
 
-    def _set_status(self, message: str) -> None:
-        self.query_one(f"#{self._wid('status')}", Static).update(message)
-
     def set_status(self, message: str) -> None:
         self._set_status(message)
 
@@ -537,10 +471,3 @@ class HttpTab(TabPane):
             headers=self._textarea("headers").text,
             verify_tls=self._checkbox("verify").value,
         )
-
-    def _persist_state(self) -> None:
-        spec = self.current_spec()
-        try:
-            self.app.save_state(spec, "http")  # type: ignore[attr-defined]
-        except Exception:
-            self._set_status("Could not save state.")
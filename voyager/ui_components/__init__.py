@@ -1,3 +1,4 @@
 from .buttons import SmallButton
+from .tab_pane import VoyagerTabPane
 
-__all__ = ["SmallButton"]
+__all__ = ["SmallButton", "VoyagerTabPane"]
@@ -6,7 +6,8 @@ from textual.widgets import Button
 class SmallButton(Button):
     """Compact button with Voyager styling."""
 
-    DEFAULT_CSS = files("voyager.ui_components").joinpath("styles/buttons.tcss").read_text()
+    # Read once at import; read_bytes skips the text-mode wrapper that read_text opens.
+    DEFAULT_CSS = files("voyager.ui_components").joinpath("styles/buttons.tcss").read_bytes().decode("utf-8")
 
     def __init__(self, label: str, *, variant: str = "default", **kwargs) -> None:
         super().__init__(label, **kwargs)
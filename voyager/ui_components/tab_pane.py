@@ -0,0 +1,81 @@
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from textual.widget import Widget
+from textual.widgets import Checkbox, Input, Static, TabPane, TextArea
+
+from ..storage import StateSaver
+from .buttons import SmallButton
+
+
+class VoyagerTabPane(TabPane):
+    """Shared plumbing for the playground tabs.
+
+    Child widgets get the id ``"{tab id}-{name}"`` for each name in ``_WIDGET_NAMES`` and
+    are looked up by that short name. Tabs that set ``_STATE_SECTION`` pass their spec to
+    ``_persist_state`` to save it in that section of the state file.
+    """
+
+    _WIDGET_NAMES: tuple[str, ...] = ()
+    _STATE_SECTION: str | None = None
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Built once; ids and selectors are otherwise re-formatted on every widget access.
+        self._wids = {name: f"{self.id}-{name}" for name in self._WIDGET_NAMES}
+        self._sels = {name: f"#{wid}" for name, wid in self._wids.items()}
+        self._widget_cache: dict[str, Widget] = {}
+        # Button id -> handler, so a click is one dict lookup.
+        self._button_actions: dict[str | None, Callable[[], object]] = {
+            self._wids[name]: action for name, action in self._button_handlers().items()
+        }
+        self._state_saver = StateSaver(self._save_spec, on_error=self._on_save_error)
+
+    def _button_handlers(self) -> dict[str, Callable[[], object]]:
+        """Map button names from ``_WIDGET_NAMES`` to what a press does."""
+        return {}
+
+    def on_button_pressed(self, event: SmallButton.Pressed) -> None:
+        action = self._button_actions.get(event.button.id)
+        if action is not None:
+            action()
+
+    def _get_widget[W: Widget](self, name: str, kind: type[W]) -> W:
+        # The tab's widgets are never replaced while mounted, so each selector is resolved once.
+        widget = self._widget_cache.get(name)
+        if widget is None:
+            widget = self._widget_cache[name] = self.query_one(self._sels[name], kind)
+        return widget  # type: ignore[return-value]
+
+    def _textarea(self, name: str) -> TextArea:
+        return self._get_widget(name, TextArea)
+
+    def _input(self, name: str) -> Input:
+        return self._get_widget(name, Input)
+
+    def _checkbox(self, name: str) -> Checkbox:
+        return self._get_widget(name, Checkbox)
+
+    def _button(self, name: str) -> SmallButton:
+        return self._get_widget(name, SmallButton)
+
+    def _set_status(self, message: str) -> None:
+        self._get_widget("status", Static).update(message)
+
+    def _persist_state(self, spec: Any) -> None:
+        # Coalesced and written on a worker thread; see StateSaver.
+        self._state_saver.schedule(spec)
+
+    def _save_spec(self, spec: Any) -> None:
+        self.app.save_state(spec, self._STATE_SECTION)  # type: ignore[attr-defined]
+
+    def _on_save_error(self, exc: Exception) -> None:
+        self.logger.debug("Could not save state: %s", exc)
+        self._set_status("Could not save state.")
+
+    def on_unmount(self) -> None:
+        # Textual also runs subclass on_unmount handlers, before this one.
+        self._state_saver.flush()
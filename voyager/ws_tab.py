@@ -1,45 +1,75 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import inspect
 import logging
-import ssl
+from collections import deque
+from collections.abc import Awaitable, Callable
 from typing import Any
 from urllib.parse import urlparse
 
 from textual.containers import Container, Horizontal, Vertical
 from textual.reactive import reactive
-from textual.widgets import Checkbox, Input, Static, TabPane, TextArea
+from textual.widgets import Checkbox, Input, Static, TextArea
 
+from . import _tls
 from .models import WebSocketTabSpec
-from .parsing import parse_headers
-from .ui_components import SmallButton
+from .parsing import LastInputCache, parse_headers
+from .ui_components import SmallButton, VoyagerTabPane
 
 try:
     import websockets  # type: ignore
 except Exception:  # pragma: no cover - optional dependency
     websockets = None  # type: ignore
 
+LOG_FLUSH_DELAY_SECONDS = 0.05
 
-def _ssl_context(verify_tls: bool) -> ssl.SSLContext:
-    context = ssl.create_default_context()
-    if not verify_tls:
-        context.check_hostname = False
-        context.verify_mode = ssl.CERT_NONE
-    return context
 
+def _resolve_connector(target: Any) -> Callable[..., Awaitable[Any]] | None:
+    """Accept a module/object exposing ``connect`` or a bare connect callable."""
+    if target is None:
+        return None
+    return getattr(target, "connect", None) or target
 
-def _validate_ws_url(endpoint: str) -> None:
+
+@functools.cache
+def _default_connector() -> Callable[..., Awaitable[Any]] | None:
+    # Resolved on first connect: websockets imports its client module lazily on attribute access.
+    return _resolve_connector(websockets)
+
+
+def _validate_ws_url(endpoint: str) -> str:
+    """Check ``endpoint`` is a ws/wss URL with a host and return its scheme."""
     parsed = urlparse(endpoint)
     if parsed.scheme not in {"ws", "wss"}:
         raise ValueError(f"Unsupported URL scheme: {parsed.scheme or 'missing'}")
     if not parsed.netloc:
         raise ValueError("Missing host in URL.")
+    return parsed.scheme
 
 
-class WebSocketTab(TabPane):
+class WebSocketTab(VoyagerTabPane):
     """WebSocket client tab."""
 
+    _WIDGET_NAMES = (
+        "endpoint",
+        "headers",
+        "verify",
+        "message",
+        "connect",
+        "disconnect",
+        "send",
+        "clear",
+        "copy-log",
+        "status",
+        "log",
+    )
+
+    _STATE_SECTION = "websocket"
+
+    LOG_MAX_LINES = 5000
+
     busy: reactive[bool] = reactive(False)
     connected: reactive[bool] = reactive(False)
     logger = logging.getLogger(__name__)
@@ -50,9 +80,24 @@ class WebSocketTab(TabPane):
         self.connection = None
         self._recv_task: asyncio.Task[Any] | None = None
         self.ws_connect = None
-
-    def _wid(self, name: str) -> str:
-        return f"{self.id}-{name}"
+        self._last_status = ""
+        self._pending: dict[str, asyncio.Task[Any]] = {}
+        self._parse_headers = LastInputCache(parse_headers)
+        # Only the newest LOG_MAX_LINES entries are kept. _log_pending holds the entries not
+        # yet shown; once anything has been evicted the next flush reloads the whole log.
+        self._log_lines: deque[str] = deque(maxlen=self.LOG_MAX_LINES)
+        self._log_pending: list[str] = []
+        self._log_evicted = False
+        self._log_flush_scheduled = False
+
+    def _button_handlers(self) -> dict[str, Callable[[], object]]:
+        return {
+            "connect": lambda: self._spawn("connect", self.connect),
+            "disconnect": lambda: self._spawn("disconnect", self.disconnect),
+            "send": lambda: self._spawn("send", self.send),
+            "clear": self._clear_log,
+            "copy-log": lambda: self._spawn("copy-log", self.copy_log),
+        }
 
     def compose(self):
         with Container(classes="layout"):
@@ -62,75 +107,72 @@ class WebSocketTab(TabPane):
                     yield Input(
                         value=self.spec.url,
                         placeholder="wss://echo.websocket.events",
-                        id=self._wid("endpoint"),
+                        id=self._wids["endpoint"],
                         classes="endpoint-input",
                     )
                     yield Static("Headers (JSON object or Key: Value per line)", classes="label")
                     yield TextArea(
                         self.spec.headers,
                         language="json",
-                        id=self._wid("headers"),
+                        id=self._wids["headers"],
                         classes="box headers-box",
                     )
                     yield Checkbox(
                         "Verify TLS certificates (recommended)",
                         value=self.spec.verify_tls,
-                        id=self._wid("verify"),
+                        id=self._wids["verify"],
                     )
                     yield Static("Message (text)", classes="label")
                     yield TextArea(
                         self.spec.message,
                         language="json",
-                        id=self._wid("message"),
+                        id=self._wids["message"],
                         classes="box body-box",
                     )
                     with Horizontal(classes="actions"):
-                        yield SmallButton("Connect", id=self._wid("connect"), variant="primary")
-                        yield SmallButton("Disconnect", id=self._wid("disconnect"), variant="ghost")
-                        yield SmallButton("Send", id=self._wid("send"), variant="ghost")
-                        yield SmallButton("Clear", id=self._wid("clear"), variant="ghost")
-                        yield SmallButton("Copy", id=self._wid("copy-log"), variant="ghost")
-                    yield Static("", id=self._wid("status"), classes="status")
+                        yield SmallButton("Connect", id=self._wids["connect"], variant="primary")
+                        yield SmallButton("Disconnect", id=self._wids["disconnect"], variant="ghost")
+                        yield SmallButton("Send", id=self._wids["send"], variant="ghost")
+                        yield SmallButton("Clear", id=self._wids["clear"], variant="ghost")
+                        yield SmallButton("Copy", id=self._wids["copy-log"], variant="ghost")
+                    yield Static("", id=self._wids["status"], classes="status")
                 with Vertical(classes="right-panel"):
                     yield TextArea(
                         "",
-                        language="markdown",
-                        id=self._wid("log"),
+                        id=self._wids["log"],
                         read_only=True,
                         classes="box response-box response-section",
                     )
 
     def watch_busy(self, busy: bool) -> None:
-        for name in ("connect", "send", "disconnect"):
-            try:
-                self._button(name).disabled = busy
-            except Exception as exc:  # pragma: no cover - defensive UI safeguard
-                self.logger.debug("Could not update %s button state: %s", name, exc)
+        self._sync_buttons()
         self._set_status("Working..." if busy else "")
 
     def watch_connected(self, connected: bool) -> None:
-        try:
-            self._button("connect").disabled = connected or self.busy
-            self._button("disconnect").disabled = not connected or self.busy
-            self._button("send").disabled = not connected or self.busy
-        except Exception:
+        if self._sync_buttons():
+            self._set_status("Connected." if connected else "Disconnected.")
+
+    def _sync_buttons(self) -> bool:
+        """Derive the action buttons from ``busy`` and ``connected``; False before mount."""
+        if not self.is_mounted:
+            return False
+        busy, connected = self.busy, self.connected
+        self._button("connect").disabled = busy or connected
+        self._button("disconnect").disabled = busy or not connected
+        self._button("send").disabled = busy or not connected
+        return True
+
+    def _spawn(self, key: str, action: Callable[[], Awaitable[Any]]) -> None:
+        """Run ``action`` in a task unless one started under ``key`` is still running.
+
+        Holding the task keeps it from being garbage collected mid-flight, and a double
+        click on Connect no longer starts a second handshake.
+        """
+        task = self._pending.get(key)
+        if task is not None and not task.done():
             return
-        if connected:
-            self._set_status("Connected.")
-        else:
-            self._set_status("Disconnected.")
-
-    async def on_button_pressed(self, event: SmallButton.Pressed) -> None:
-        if event.button.id == self._wid("connect"):
-            asyncio.create_task(self.connect())
-        elif event.button.id == self._wid("disconnect"):
-            asyncio.create_task(self.disconnect())
-        elif event.button.id == self._wid("send"):
-            asyncio.create_task(self.send())
-        elif event.button.id == self._wid("clear"):
-            self._clear_log()
-        elif event.button.id == self._wid("copy-log"):
-            asyncio.create_task(self.copy_log())
+        task = self._pending[key] = asyncio.create_task(action())
+        task.add_done_callback(lambda _: self._pending.pop(key, None))
 
     async def connect(self, ws_connect: Callable[..., Any] | None = None) -> None:
         if self.busy:
@@ -144,34 +186,29 @@ class WebSocketTab(TabPane):
             return
 
         try:
-            _validate_ws_url(endpoint)
+            scheme = _validate_ws_url(endpoint)
         except ValueError as exc:
             self._set_status(str(exc))
             return
 
         try:
-            headers = parse_headers(raw_headers)
+            headers = self._parse_headers(raw_headers)
         except ValueError as exc:
             self._set_status(str(exc))
             return
 
-        connect_callable = ws_connect or self.ws_connect or websockets
-        if connect_callable is None:
+        override = ws_connect or self.ws_connect
+        connector = _default_connector() if override is None else _resolve_connector(override)
+        if connector is None:
             self._set_status("Install the 'websockets' package to use this tab.")
             return
 
         self.busy = True
-        await self.disconnect()
+        if self.connection is not None or self._recv_task is not None:
+            await self.disconnect()
         self._set_status(f"Connecting to {endpoint} ...")
         try:
-            connector = getattr(connect_callable, "connect", None)
-            if connector:
-                self.connection = await connector(endpoint, **_connect_kwargs(headers, verify_tls))  # type: ignore[arg-type]
-            else:
-                self.connection = await connect_callable(  # type: ignore[operator,union-attr]
-                    endpoint,
-                    **_connect_kwargs(headers, verify_tls),
-                )
+            self.connection = await connector(endpoint, **_connect_kwargs(headers, verify_tls, scheme))
         except Exception as exc:
             self.logger.debug("WebSocket connection failed: %s", exc)
             self._append_log(f"Connect failed: {exc}")
@@ -182,11 +219,12 @@ class WebSocketTab(TabPane):
         self.connected = True
         self.busy = False
         self._append_log(f"Connected to {endpoint}")
-        self._persist_state()
+        self._persist_state(self.current_spec())
         self._recv_task = asyncio.create_task(self._recv_loop(self.connection))
 
     async def disconnect(self) -> None:
-        self.connected = False
+        if self.connected:
+            self.connected = False
         if self._recv_task and not self._recv_task.done():
             self._recv_task.cancel()
             try:
@@ -208,11 +246,11 @@ class WebSocketTab(TabPane):
     async def send(self) -> None:
         if self.busy:
             return
-        message = self._textarea("message").text
-        if not self.connection or not self.connected:
-            await self.connect()
+        # Connecting is left to the Connect button; a handshake from Send would stall it.
         if not self.connection or not self.connected:
+            self._set_status("Not connected.")
             return
+        message = self._textarea("message").text
 
         try:
             await self.connection.send(message)  # type: ignore[union-attr]
@@ -224,10 +262,11 @@ class WebSocketTab(TabPane):
             return
         self._append_log(f"Sent: {message.strip() or '<empty>'}")
         self._set_status("Message sent.")
-        self._persist_state()
+        self._persist_state(self.current_spec())
 
     async def copy_log(self) -> None:
-        text = self._textarea("log").text
+        self._flush_log()
+        text = "\n".join(self._log_lines)
         if not text.strip():
             self._set_status("Nothing to copy.")
             return
@@ -240,11 +279,37 @@ class WebSocketTab(TabPane):
         self._set_status("Log copied.")
 
     def _append_log(self, message: str) -> None:
-        current = self._textarea("log").text
-        new_text = (current + "\n" if current else "") + message
-        self._textarea("log").load_text(new_text)
+        # Buffered so a burst of frames costs one widget reload per tick, not one per message.
+        if len(self._log_lines) == self._log_lines.maxlen:
+            self._log_evicted = True
+        elif not self._log_evicted:
+            self._log_pending.append(message)
+        self._log_lines.append(message)
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.set_timer(LOG_FLUSH_DELAY_SECONDS, self._flush_log)
+
+    def _flush_log(self) -> None:
+        self._log_flush_scheduled = False
+        log = self._textarea("log")
+        if self._log_evicted:
+            log.load_text("\n".join(self._log_lines))
+        elif self._log_pending:
+            # Only the new tail is inserted (and re-highlighted), not the whole document.
+            chunk = "\n".join(self._log_pending)
+            if len(self._log_lines) > len(self._log_pending):
+                chunk = "\n" + chunk
+            log.insert(chunk, log.document.end)
+            # insert() is undoable and read_only does not block ctrl+z; without this an undo
+            # would leave the widget out of step with _log_lines.
+            log.history.clear()
+        self._log_pending.clear()
+        self._log_evicted = False
 
     def _clear_log(self) -> None:
+        self._log_lines.clear()
+        self._log_pending.clear()
+        self._log_evicted = False
         self._textarea("log").load_text("")
         self._set_status("Cleared.")
 
@@ -254,20 +319,12 @@ class WebSocketTab(TabPane):
     async def copy_response(self) -> None:
         await self.copy_log()
 
-    def _textarea(self, name: str) -> TextArea:
-        return self.query_one(f"#{self._wid(name)}", TextArea)
-
-    def _input(self, name: str) -> Input:
-        return self.query_one(f"#{self._wid(name)}", Input)
-
-    def _checkbox(self, name: str) -> Checkbox:
-        return self.query_one(f"#{self._wid(name)}", Checkbox)
-
-    def _button(self, name: str) -> SmallButton:
-        return self.query_one(f"#{self._wid(name)}", SmallButton)
-
     def _set_status(self, message: str) -> None:
-        self.query_one(f"#{self._wid('status')}", Static).update(message)
+        # Watchers re-send the same text often; skip the Static refresh when nothing changed.
+        if message == self._last_status:
+            return
+        self._last_status = message
+        self._get_widget("status", Static).update(message)
 
     async def _recv_loop(self, connection) -> None:
         try:
@@ -288,7 +345,15 @@ class WebSocketTab(TabPane):
             self.connection = None
 
     async def on_unmount(self) -> None:  # type: ignore[override]
+        # VoyagerTabPane.on_unmount flushes any pending state save after this handler.
+        # A connect still in flight would otherwise open a socket after the disconnect below.
+        pending = list(self._pending.values())
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
         await self.disconnect()
+        self._widget_cache.clear()
+        self._last_status = ""
 
     def current_spec(self) -> WebSocketTabSpec:
         return WebSocketTabSpec(
@@ -300,22 +365,23 @@ class WebSocketTab(TabPane):
             verify_tls=self._checkbox("verify").value,
         )
 
-    def _persist_state(self) -> None:
-        spec = self.current_spec()
-        try:
-            self.app.save_state(spec, "websocket")  # type: ignore[attr-defined]
-        except Exception:
-            self._set_status("Could not save state.")
-
 
-def _connect_kwargs(headers: dict[str, str], verify_tls: bool) -> dict[str, Any]:
-    """Build connect kwargs compatible with websockets version."""
-    kwargs: dict[str, Any] = {"ssl": _ssl_context(verify_tls)}
-    params = set()
+@functools.lru_cache(maxsize=1)
+def _ws_connect_params() -> frozenset[str]:
+    """Parameter names of ``websockets.connect``; fixed for the process, so inspected once."""
     try:
-        params = set(inspect.signature(websockets.connect).parameters)
+        return frozenset(inspect.signature(websockets.connect).parameters)
     except Exception:
-        params = set()
+        return frozenset()
+
+
+def _connect_kwargs(headers: dict[str, str], verify_tls: bool, scheme: str) -> dict[str, Any]:
+    """Build connect kwargs compatible with websockets version."""
+    kwargs: dict[str, Any] = {}
+    # Plain ws:// never uses TLS, so no context is built (websockets rejects one there anyway).
+    if scheme == "wss":
+        kwargs["ssl"] = _tls.ssl_context(verify_tls)
+    params = _ws_connect_params()
     if "ping_interval" in params:
         kwargs["ping_interval"] = 20
     if "additional_headers" in params: